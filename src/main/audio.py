@@ -0,0 +1,143 @@
+# audio.py
+
+import statistics
+import threading
+import time
+
+import pygame
+from settings import Settings
+
+
+class Audio:
+    """Define o subsistema de áudio, com sons decodificados uma única vez e compartilhados entre as cenas"""
+
+    def __init__(self, settings: Settings) -> None:
+        """Inicializa o subsistema de áudio"""
+        self.settings = settings
+        self.paths = {
+            "restart.sound": self.settings.restart_sound,
+            "start.sound": self.settings.start_sound,
+            "collision.sound": self.settings.collision_sound,
+            "score.sound": self.settings.score_sound,
+            "winner.sound": self.settings.winner_sound,
+        }
+        self.names = list(self.paths)
+        self.channels = {name: index for index, name in enumerate(self.names)}
+        self.sounds: dict[str, pygame.mixer.Sound | None] = {}
+        self.missing: list[str] = []
+        self.music = False
+        self.music_pending = False
+        self.buffer = self.settings.mixer_buffer
+        self.latency = None
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.load, daemon=True)
+
+    def start(self) -> None:
+        """Inicia o carregamento do áudio em segundo plano"""
+        self.thread.start()
+
+    def wait(self) -> None:
+        """Aguarda o fim do carregamento do áudio"""
+        self.ready.wait()
+
+    def load(self) -> None:
+        """Ajusta o mixer e decodifica os sons e a música"""
+        if pygame.mixer.get_init() is not None:
+            if self.settings.mixer_buffer_auto:
+                self.tune()
+            else:
+                self.latency = self.measure_latency()
+
+            for name in self.names:
+                self.sounds[name] = self.decode(self.paths[name], name)
+
+            for channel in self.channels.values():
+                pygame.mixer.Channel(channel).set_volume(self.settings.sound_volume)
+
+            if self.settings.background_music:
+                try:
+                    pygame.mixer.music.load(self.settings.background_music)
+                    pygame.mixer.music.set_volume(self.settings.music_volume)
+                    self.music = True
+                except pygame.error:
+                    self.missing.append("background.music")
+        else:
+            self.missing.extend(self.names)
+            self.missing.append("background.music")
+
+        with self.lock:
+            if self.music_pending and self.music:
+                pygame.mixer.music.play(-1)
+
+            self.ready.set()
+
+    def decode(self, path: str, name: str) -> pygame.mixer.Sound | None:
+        """Decodifica um som para PCM, registrando-o como ausente em caso de falha"""
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error:
+            self.missing.append(name)
+            return None
+
+    def tune(self) -> None:
+        """Reduz o buffer do mixer até a latência medida ficar dentro da meta"""
+        self.latency = self.measure_latency()
+
+        while self.latency > self.settings.mixer_latency_target and self.buffer > self.settings.mixer_buffer_min:
+            frequency, size, channels = pygame.mixer.get_init()
+            self.buffer //= 2
+            pygame.mixer.quit()
+            pygame.mixer.init(frequency, size, channels, self.buffer)
+            self.latency = self.measure_latency()
+
+    def measure_latency(self) -> float:
+        """Mede a latência de saída tocando um som silencioso de duração conhecida"""
+        frequency, size, channels = pygame.mixer.get_init()
+        duration = 0.05
+        silence = pygame.mixer.Sound(buffer=bytes(int(frequency * duration) * channels * (abs(size) // 8)))
+        channel = pygame.mixer.Channel(pygame.mixer.get_num_channels() - 1)
+        delays = []
+
+        for _ in range(5):
+            start = time.perf_counter()
+            channel.play(silence)
+
+            while channel.get_busy():
+                time.sleep(0.0005)
+
+            delays.append(max(time.perf_counter() - start - silence.get_length(), 0.0))
+
+        return statistics.median(delays) + (self.buffer / frequency)
+
+    def play(self, name: str) -> None:
+        """Reproduz um som no seu canal, se ele estiver disponível"""
+        if not self.ready.is_set():
+            return
+
+        sound = self.sounds.get(name)
+
+        if sound is not None:
+            pygame.mixer.Channel(self.channels[name]).play(sound)
+
+    def stop(self) -> None:
+        """Interrompe todos os sons"""
+        if self.ready.is_set() and pygame.mixer.get_init() is not None:
+            for channel in self.channels.values():
+                pygame.mixer.Channel(channel).stop()
+
+    def play_music(self) -> None:
+        """Reproduz a música de fundo, assim que estiver carregada"""
+        with self.lock:
+            if not self.ready.is_set():
+                self.music_pending = True
+            elif self.music:
+                pygame.mixer.music.play(-1)
+
+    def stop_music(self) -> None:
+        """Interrompe a música de fundo"""
+        with self.lock:
+            self.music_pending = False
+
+            if self.ready.is_set() and self.music:
+                pygame.mixer.music.stop()
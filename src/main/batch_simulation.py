@@ -0,0 +1,229 @@
+# batch_simulation.py
+
+import numpy as np
+import pygame
+from ball_state import BallState
+from settings import Settings
+from side import Side
+
+
+class BatchSimulation:
+    """Define a simulação vetorizada de várias partidas independentes"""
+
+    def __init__(self, bounds: pygame.Rect, settings: Settings, count: int, seed: int | None = None) -> None:
+        """Inicializa a simulação vetorizada de várias partidas"""
+        self.settings = settings
+        self.bounds = pygame.Rect(bounds)
+        self.count = count
+        self.random = np.random.default_rng(seed)
+        self.time_step = self.settings.time_step
+        self.auto_reset = True
+
+        # Geometria fixa, igual à da simulação escalar
+        self.ball_size = self.settings.ball_size
+        self.paddle_width = self.settings.paddle_width
+        self.paddle_height = self.settings.paddle_height
+        self.left_paddle_left = self.bounds.left + (self.paddle_width * 3)
+        self.right_paddle_left = self.bounds.right - (self.paddle_width * 3) - self.paddle_width
+        self.paddle_top_min = self.bounds.top + self.settings.wall_size
+        self.paddle_top_max = self.bounds.bottom - self.settings.wall_size - self.paddle_height
+        self.paddle_top_start = self.bounds.centery - (self.paddle_height // 2)
+        self.top_wall_bottom = self.bounds.top + self.settings.wall_size
+        self.bottom_wall_top = self.bounds.bottom - self.settings.wall_size
+        self.left_goal_right = self.bounds.left - (self.settings.goal_size * 2) + self.settings.goal_size
+        self.right_goal_left = self.bounds.right + (self.settings.goal_size * 2) - self.settings.goal_size
+        self.serve_left = self.bounds.centerx - (self.ball_size // 2)
+        self.serve_start = self.bounds.top + (self.settings.wall_size * 2)
+        self.serve_step = self.ball_size * 2
+        self.serve_count = -(-(self.bounds.bottom - self.serve_start) // self.serve_step)
+
+        # Estado das partidas
+        self.ball_x = np.zeros(count, dtype=np.int64)
+        self.ball_y = np.zeros(count, dtype=np.int64)
+        self.ball_vx = np.zeros(count, dtype=np.float64)
+        self.ball_vy = np.zeros(count, dtype=np.float64)
+        self.ball_acceleration = np.zeros(count, dtype=np.float64)
+        self.ball_state = np.zeros(count, dtype=np.int8)
+        self.ball_accumulator = np.zeros(count, dtype=np.float64)
+        self.paddles_y = np.zeros((count, 2), dtype=np.int64)
+        self.paddles_vy = np.zeros((count, 2), dtype=np.float64)
+        self.paddles_acceleration = np.zeros((count, 2), dtype=np.float64)
+        self.scores = np.zeros((count, 2), dtype=np.int64)
+        self.wins = np.zeros((count, 2), dtype=np.int64)
+        self.steps = np.zeros(count, dtype=np.int64)
+
+        # Ocorrências do último passo
+        self.stroked = np.zeros(count, dtype=bool)
+        self.bounced = np.zeros(count, dtype=bool)
+        self.scored = np.full(count, -1, dtype=np.int8)
+        self.finished = np.zeros(count, dtype=bool)
+        self.winner = np.full(count, -1, dtype=np.int8)
+
+        self.reset()
+
+    def reset(self, mask: np.ndarray | None = None) -> None:
+        """Reinicia as partidas selecionadas, ou todas"""
+        if mask is None:
+            mask = np.ones(self.count, dtype=bool)
+
+        self.ball_x[mask] = -self.ball_size
+        self.ball_y[mask] = -self.ball_size
+        self.ball_vx[mask] = 0.0
+        self.ball_vy[mask] = 0.0
+        self.ball_acceleration[mask] = self.settings.ball_acceleration
+        self.ball_state[mask] = BallState.READY.value
+        self.ball_accumulator[mask] = 0.0
+        self.paddles_y[mask] = self.paddle_top_start
+        self.paddles_vy[mask] = 0.0
+        self.paddles_acceleration[mask] = self.settings.paddle_acceleration
+        self.scores[mask] = 0
+        self.steps[mask] = 0
+
+    def set_directions(self, up: np.ndarray, down: np.ndarray) -> None:
+        """Atualiza a direção das raquetes a partir das intenções, no formato (N, 2)"""
+        moving_down = down & ~up
+        moving_up = up & ~down
+        same_direction = (moving_down & (self.paddles_vy > 0)) | (moving_up & (self.paddles_vy < 0))
+
+        self.paddles_acceleration = np.where(
+            same_direction,
+            self.paddles_acceleration + self.settings.paddle_acceleration_increment,
+            self.settings.paddle_acceleration,
+        )
+        speed = self.settings.paddle_speed * self.paddles_acceleration
+        self.paddles_vy = np.where(moving_down, speed, np.where(moving_up, -speed, 0.0))
+
+    def step(self) -> None:
+        """Avança todas as partidas em um passo fixo"""
+        dt = self.time_step
+        self.update_paddles(dt)
+        self.update_balls(dt)
+
+        ball_left = self.ball_x
+        ball_right = self.ball_x + self.ball_size
+        ball_top = self.ball_y
+        ball_bottom = self.ball_y + self.ball_size
+
+        # Colisão com as raquetes
+        overlap_y = (ball_top[:, None] < self.paddles_y + self.paddle_height) & (ball_bottom[:, None] > self.paddles_y)
+        hit_left = overlap_y[:, 0] & (ball_left < self.left_paddle_left + self.paddle_width)
+        hit_left &= ball_right > self.left_paddle_left
+        hit_right = overlap_y[:, 1] & (ball_left < self.right_paddle_left + self.paddle_width)
+        hit_right &= (ball_right > self.right_paddle_left) & ~hit_left
+        stroke_left = hit_left & (self.ball_vx < 0)
+        stroke_right = hit_right & (self.ball_vx > 0)
+        self.stroked = stroke_left | stroke_right
+
+        if self.stroked.any():
+            self.stroke(stroke_left, stroke_right)
+
+        # Colisão com as paredes
+        inside_x = (ball_right > self.bounds.left) & (ball_left < self.bounds.right)
+        hit_top = inside_x & (ball_top < self.top_wall_bottom)
+        hit_bottom = inside_x & (ball_bottom > self.bottom_wall_top) & ~hit_top
+        self.bounced = (hit_top & (self.ball_vy < 0)) | (hit_bottom & (self.ball_vy > 0))
+        self.ball_vy = np.where(self.bounced, -self.ball_vy, self.ball_vy)
+
+        # Colisão com os gols
+        running = self.ball_state == BallState.RUNNING.value
+        goal_left = running & (ball_left < self.left_goal_right)
+        goal_right = running & (ball_right > self.right_goal_left) & ~goal_left
+        self.scored = np.where(goal_left, Side.LEFT.value, np.where(goal_right, Side.RIGHT.value, -1)).astype(np.int8)
+        self.scores[:, 1] += goal_left
+        self.scores[:, 0] += goal_right
+        self.handle_goals(goal_left | goal_right)
+
+        self.steps += 1
+
+    def update_paddles(self, dt: float) -> None:
+        """Atualiza o estado das raquetes"""
+        changey = np.rint(self.paddles_vy * dt).astype(np.int64)
+        paddles_top = self.paddles_y + changey
+        inside = (paddles_top >= self.paddle_top_min) & (paddles_top <= self.paddle_top_max)
+        clamped = np.where(
+            self.paddles_vy < 0,
+            self.paddle_top_min,
+            np.where(self.paddles_vy > 0, self.paddle_top_max, self.paddles_y),
+        )
+        self.paddles_y = np.where(inside, paddles_top, clamped)
+
+    def update_balls(self, dt: float) -> None:
+        """Atualiza o estado das bolas"""
+        running = self.ball_state == BallState.RUNNING.value
+        self.ball_x += np.where(running, np.rint(self.ball_vx * dt), 0).astype(np.int64)
+        self.ball_y += np.where(running, np.rint(self.ball_vy * dt), 0).astype(np.int64)
+
+        ready = self.ball_state == BallState.READY.value
+
+        if not ready.any():
+            return
+
+        self.ball_accumulator += np.where(ready, dt, 0.0)
+        settling = ready & (self.ball_accumulator >= self.settings.ball_ready_time_appear)
+        settling &= self.ball_accumulator < self.settings.ball_ready_time_settledown
+        serving = ready & (self.ball_accumulator >= self.settings.ball_ready_time_play)
+
+        if settling.any():
+            self.reset_ball_positions(settling)
+
+        if serving.any():
+            self.reset_ball_velocities(serving)
+            self.ball_accumulator[serving] = 0.0
+            self.ball_state[serving] = BallState.RUNNING.value
+
+    def reset_ball_positions(self, mask: np.ndarray) -> None:
+        """Reconfigura a posição das bolas selecionadas"""
+        size = int(mask.sum())
+        y = self.serve_start + self.random.integers(0, self.serve_count, size) * self.serve_step
+        self.ball_x[mask] = self.serve_left
+        self.ball_y[mask] = y - (self.ball_size // 2)
+
+    def reset_ball_velocities(self, mask: np.ndarray) -> None:
+        """Reinicia o vetor velocidade das bolas selecionadas"""
+        size = int(mask.sum())
+        angle_max = self.settings.ball_angle_max
+        degrees = self.random.uniform(-angle_max, angle_max, size)
+        degrees += np.where(self.random.integers(0, 2, size) == 0, 180.0, 0.0)
+        radians = np.radians(degrees)
+        self.ball_vx[mask] = self.settings.ball_speed * np.cos(radians)
+        self.ball_vy[mask] = self.settings.ball_speed * np.sin(radians)
+        self.ball_acceleration[mask] = self.settings.ball_acceleration
+
+    def stroke(self, stroke_left: np.ndarray, stroke_right: np.ndarray) -> None:
+        """Gerencia a rebatida das bolas"""
+        stroked = stroke_left | stroke_right
+        ball_centery = self.ball_y + (self.ball_size // 2)
+        paddle_centery = np.where(stroke_left, self.paddles_y[:, 0], self.paddles_y[:, 1]) + (self.paddle_height // 2)
+        collision_point = ball_centery - paddle_centery
+
+        degrees = self.settings.ball_angle_max * (collision_point / (self.paddle_height / 2))
+        degrees = np.where(stroke_right, -degrees, degrees)
+        # A velocidade horizontal é invertida antes da rebatida
+        degrees = np.where(-self.ball_vx < 0, degrees + 180.0, degrees)
+        radians = np.radians(degrees)
+        vx = self.settings.ball_speed * np.cos(radians) * self.ball_acceleration
+        vy = self.settings.ball_speed * np.sin(radians) * self.ball_acceleration
+        accelerate = stroked & (np.hypot(vx, vy) <= self.settings.ball_speed_max)
+
+        self.ball_vx = np.where(stroked, vx, self.ball_vx)
+        self.ball_vy = np.where(stroked, vy, self.ball_vy)
+        self.ball_acceleration += np.where(accelerate, self.settings.ball_acceleration_increment, 0.0)
+
+    def handle_goals(self, mask: np.ndarray) -> None:
+        """Gerencia o placar e o fim das partidas"""
+        points_max = self.settings.game_points_max
+        self.finished = mask & (self.scores.max(axis=1) >= points_max)
+        self.ball_state[mask & ~self.finished] = BallState.READY.value
+        self.winner[:] = -1
+
+        if not self.finished.any():
+            return
+
+        left_won = self.scores[:, 0] > self.scores[:, 1]
+        self.winner[self.finished] = np.where(left_won[self.finished], Side.LEFT.value, Side.RIGHT.value)
+        self.wins[:, 0] += self.finished & left_won
+        self.wins[:, 1] += self.finished & ~left_won
+        self.ball_state[self.finished] = BallState.WAITING.value
+
+        if self.auto_reset:
+            self.reset(self.finished)
@@ -0,0 +1,13 @@
+# body.py
+
+import pygame
+from side import Side
+
+
+class Body:
+    """Define a geometria de um corpo da simulação"""
+
+    def __init__(self, rect: pygame.Rect, side: Side | None = None) -> None:
+        """Inicializa a geometria de um corpo da simulação"""
+        self.rect = rect
+        self.side = side
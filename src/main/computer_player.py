@@ -0,0 +1,130 @@
+# computer_player.py
+
+import random
+
+from side import Side
+from simulation import RUNNING, Simulation
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y
+
+# Tempo de reação e erro de mira de cada nível de dificuldade
+DIFFICULTIES = {
+    "easy": (0.30, 90.0),
+    "normal": (0.15, 35.0),
+    "hard": (0.05, 5.0),
+}
+
+
+class ComputerPlayer:
+    """Define um jogador controlado pelo computador, que calcula onde a bola vai cruzar a sua raquete"""
+
+    def __init__(
+        self,
+        simulation: Simulation,
+        side: Side,
+        delay: float,
+        error: float,
+        seed: int | None = None,
+    ) -> None:
+        """Inicializa o jogador do lado informado, com o tempo de reação e o erro de mira indicados"""
+        self.simulation = simulation
+        self.settings = simulation.settings
+        self.side = side
+        self.index = side.value
+        self.delay = delay
+        self.error = error
+        self.random = random.Random(seed)
+        self.paddle = simulation.paddles[self.index]
+        self.position = PADDLE_Y[self.index]
+
+        # Plano da raquete, onde a borda da bola a encontra
+        if side == Side.LEFT:
+            self.plane = self.paddle.rect.right
+        else:
+            self.plane = self.paddle.rect.left - self.settings.ball_size
+
+        # Faixa vertical em que a bola se move entre as paredes
+        self.top = simulation.bounds.top + self.settings.wall_size
+        self.bottom = simulation.bounds.bottom - self.settings.wall_size - self.settings.ball_size
+        self.tolerance = self.settings.paddle_height / 4
+        self.reset()
+
+    def reset(self) -> None:
+        """Esquece o plano atual, voltando para o centro"""
+        self.motion = (0.0, 0.0, 0.0)
+        self.target = self.simulation.bounds.centery
+        self.next_target = self.target
+        self.wait = 0.0
+        self.plans = 0
+
+    def intercept(self) -> float | None:
+        """Retorna a altura do centro da bola ao cruzar o plano da raquete, ou None se ela não vem para cá"""
+        values = self.simulation.state.values
+        vx = values[BALL_VX]
+
+        if values[BALL_STATE] != RUNNING:
+            return None
+
+        if (vx >= 0 and self.side == Side.LEFT) or (vx <= 0 and self.side == Side.RIGHT):
+            return None
+
+        vy = values[BALL_VY]
+        margin = 0.0
+
+        # No modo discreto a bola anda um número inteiro de pixels por passo
+        # e entra em média meio passo na parede antes de refletir
+        if self.settings.physics_collision_mode == "discrete":
+            step = self.simulation.time_step
+            vx = round(vx * step) / step
+            vy = round(vy * step) / step
+            margin = abs(vy) * step / 2
+
+        if vx == 0:
+            return None
+
+        time = (self.plane - values[BALL_X]) / vx
+
+        if time < 0:
+            return None
+
+        # Desdobra as reflexões nas paredes: a trajetória reta é dobrada no intervalo entre elas
+        top = self.top - margin
+        span = self.bottom - self.top + 2 * margin
+        offset = (values[BALL_Y] + vy * time - top) % (2 * span)
+
+        if offset > span:
+            offset = 2 * span - offset
+
+        return top + offset + self.settings.ball_size / 2
+
+    def plan(self) -> None:
+        """Escolhe o novo alvo, que só passa a valer depois do tempo de reação"""
+        intercept = self.intercept()
+        self.plans += 1
+
+        if intercept is None:
+            self.next_target = self.simulation.bounds.centery
+        else:
+            self.next_target = intercept + self.random.uniform(-self.error, self.error)
+
+        self.wait = self.delay
+
+    def play(self, dt: float) -> None:
+        """Replaneja quando a bola muda de direção e move a raquete em direção ao alvo"""
+        values = self.simulation.state.values
+        motion = (values[BALL_STATE], values[BALL_VX], values[BALL_VY])
+
+        # Rebatidas, quiques nas paredes, gols e saques mudam o estado ou a velocidade da bola
+        if motion != self.motion:
+            self.motion = motion
+            self.plan()
+
+        if self.wait > 0:
+            self.wait -= dt
+
+        if self.wait <= 0:
+            self.target = self.next_target
+
+        center = values[self.position] + self.paddle.rect.height / 2
+        up = center > self.target + self.tolerance
+        down = center < self.target - self.tolerance
+        self.simulation.set_direction(self.side, up, down)
@@ -1,25 +1,26 @@
 # dashed_line.py
 
 import pygame
-from dash import Dash
+from settings import Settings
 
 
 class DashedLine:
     """Define uma instância do traçado central"""
 
-    def __init__(self, screen: pygame.surface.Surface, settings: dict) -> None:
+    def __init__(self, bounds: pygame.Rect, settings: Settings) -> None:
         """Inicializa uma instância do traçado central"""
         self.settings = settings
-        self.dash_sprites: list[Dash] = []
+        self.dashes: list[pygame.Rect] = []
         dashes_count = round(
-            (screen.get_rect().height - (self.settings["wall.size"] * 2)) / self.settings["dash.size"] * 2
+            (bounds.height - (self.settings.wall_size * 2)) / self.settings.dash_size * 2
         )
 
         for i in range(dashes_count):
-            dash_sprite = Dash(screen, self.settings)
-            dash_sprite.rect.centery = (i + 1) * self.settings["dash.size"] * 2
-            self.dash_sprites.append(dash_sprite)
+            dash = pygame.Rect(0, 0, self.settings.dash_size, self.settings.dash_size)
+            dash.centerx = bounds.centerx
+            dash.centery = (i + 1) * self.settings.dash_size * 2
+            self.dashes.append(dash)
 
-    def get(self) -> list[Dash]:
-        """Retorna os traços do traçado central"""
-        return self.dash_sprites
+    def get(self) -> list[pygame.Rect]:
+        """Retorna as áreas dos traços do traçado central"""
+        return self.dashes
@@ -0,0 +1,149 @@
+# environment.py
+
+import numpy as np
+import pygame
+from audio import Audio
+from computer_player import DIFFICULTIES, ComputerPlayer
+from game import Game
+from settings import Settings
+from side import Side
+from state import BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y, SCORE
+from text_cache import TextCache
+
+# Intenção de cada ação: parada, subir e descer
+ACTIONS = [(False, False), (True, False), (False, True)]
+OBSERVATIONS = ["state", "pixels"]
+
+
+class Environment:
+    """Define um ambiente de aprendizado por reforço em volta de uma sessão do jogo, no estilo do Gym"""
+
+    def __init__(
+        self,
+        settings: Settings,
+        side: Side = Side.RIGHT,
+        observation: str = "state",
+        frame_skip: int = 4,
+        difficulty: str | None = "normal",
+        seconds_max: float | None = None,
+    ) -> None:
+        """Inicializa o ambiente do agente no lado informado, contra o computador na dificuldade indicada"""
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"Observation must be one of {OBSERVATIONS}, got {observation!r}")
+
+        if frame_skip <= 0:
+            raise ValueError(f"Frame skip must be positive, got {frame_skip!r}")
+
+        if side not in [Side.LEFT, Side.RIGHT]:
+            raise ValueError(f"Side must be LEFT or RIGHT, got {side!r}")
+
+        self.settings = settings
+        self.side = side
+        self.index = side.value
+        self.opponent_index = 1 - self.index
+        self.observation = observation
+        self.frame_skip = frame_skip
+        self.steps_max = None if seconds_max is None else round(seconds_max / settings.time_step)
+        self.action_count = len(ACTIONS)
+
+        # A tela é uma superfície sobre a memória de um array: a imagem observada é uma vista dela, sem cópia
+        width, height = settings.render_size
+        self.buffer = np.zeros((height, width, 4), dtype=np.uint8)
+        self.pixels = self.buffer[:, :, :3]
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        self.screen = pygame.image.frombuffer(self.buffer, (width, height), "RGBX")
+        self.game = Game(self.screen, settings, TextCache(settings), Audio(settings))
+        self.simulation = self.game.simulation
+        self.game.computer = None
+
+        if difficulty is not None:
+            opponent = Side.LEFT if side == Side.RIGHT else Side.RIGHT
+            self.game.computer = ComputerPlayer(self.simulation, opponent, *DIFFICULTIES[difficulty])
+
+        # Escalas que levam o vetor de estado para valores próximos de [-1, 1]
+        self.scales = np.array(
+            [
+                settings.screen_width,
+                settings.screen_height,
+                settings.ball_speed_max,
+                settings.ball_speed_max,
+                settings.screen_height,
+                settings.screen_height,
+            ],
+            dtype=np.float32,
+        )
+
+        if observation == "state":
+            self.observation_shape = self.scales.shape
+        else:
+            self.observation_shape = self.pixels.shape
+
+        self.steps = 0
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, dict]:
+        """Começa uma nova partida e retorna a primeira observação"""
+        self.game.reset(seed)
+
+        if self.game.computer is not None:
+            self.game.computer.random.seed(seed)
+
+        self.steps = 0
+        return self.observe(), self.info()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """Mantém a ação por frame_skip passos fixos e retorna a observação, a recompensa e o fim do episódio"""
+        up, down = ACTIONS[action]
+        values = self.simulation.state.values
+        reward = 0.0
+        score = SCORE[self.index]
+        opponent_score = SCORE[self.opponent_index]
+
+        for _ in range(self.frame_skip):
+            scores = (values[score], values[opponent_score])
+
+            # A intenção é aplicada a cada passo, como o teclado lido a cada quadro
+            self.simulation.set_direction(self.side, up, down)
+            self.game.process_logic(self.settings.time_step)
+            self.steps += 1
+
+            # Os pontos marcados pela simulação ao tratar um gol formam a recompensa
+            reward += values[score] - scores[0]
+            reward -= values[opponent_score] - scores[1]
+
+            if self.simulation.winner is not None:
+                break
+
+        terminated = self.simulation.winner is not None
+        truncated = not terminated and self.steps_max is not None and self.steps >= self.steps_max
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def observe(self) -> np.ndarray:
+        """Retorna o vetor de estado ou a imagem da tela, que é reaproveitada a cada passo"""
+        if self.observation == "pixels":
+            self.game.process_frames()
+            return self.pixels
+
+        values = self.simulation.state.values
+        vector = np.array(
+            [
+                values[BALL_X],
+                values[BALL_Y],
+                values[BALL_VX],
+                values[BALL_VY],
+                values[PADDLE_Y[self.index]],
+                values[PADDLE_Y[self.opponent_index]],
+            ],
+            dtype=np.float32,
+        )
+        return vector / self.scales
+
+    def info(self) -> dict:
+        """Retorna o placar e o número de passos da partida"""
+        return {
+            "score": self.simulation.left_score if self.side == Side.LEFT else self.simulation.right_score,
+            "opponent_score": self.simulation.right_score if self.side == Side.LEFT else self.simulation.left_score,
+            "steps": self.steps,
+        }
@@ -9,3 +9,6 @@ class Event(Enum):
     """Define um enumerador de eventos para o jogo"""
 
     START = pygame.USEREVENT + 1
+    COLLISION = pygame.USEREVENT + 2
+    SCORE = pygame.USEREVENT + 3
+    WINNER = pygame.USEREVENT + 4
@@ -1,107 +1,177 @@
 # game.py
 
+import math
+import os
+import time
+
+import numpy as np
 import pygame
+from audio import Audio
 from ball import Ball
-from ball_state import BallState
+from computer_player import DIFFICULTIES, ComputerPlayer
 from dashed_line import DashedLine
 from event import Event
-from goal import Goal
+from keyboard import Keyboard
+from multiball import Multiball
 from paddle import Paddle
+from playfield import Playfield
+from recorder import Recorder
 from scene import Scene
+from settings import Settings
 from side import Side
-from wall import Wall
+from simulation import Simulation
+from text import Text
+from text_cache import TextCache
+from view import View
 
 
 class Game:
     """Define uma sessão do jogo"""
 
-    def __init__(self, screen: pygame.surface.Surface, settings: dict) -> None:
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        settings: Settings,
+        text_cache: TextCache,
+        audio: Audio,
+        keyboard: Keyboard | None = None,
+    ) -> None:
         """Inicializa uma sessão do jogo"""
         self.settings = settings
         self.scene_name = Scene.GAME
         self.next_scene_name = Scene.GAME
         self.screen = screen
+        self.text_cache = text_cache
+        self.audio = audio
+        self.keyboard = keyboard if keyboard is not None else Keyboard(settings)
+        self.step_time = 0.0
+        self.view = View(self.settings)
+
+        # Simulação, nas unidades lógicas da tela qualquer que seja a resolução interna
+        bounds = pygame.Rect(0, 0, self.settings.screen_width, self.settings.screen_height)
+        self.simulation = Simulation(bounds, self.settings)
+
+        # Bolas extras do modo festa, desenhadas todas com a imagem da bola
+        self.multiball = None
+        self.multiball_rects: list[pygame.Rect] = []
+
+        if self.settings.ball_count > 1:
+            self.multiball = Multiball(self.simulation)
+
+        # Jogador controlado pelo computador, se houver
+        self.computer = None
+
+        if self.settings.ai_side != "none":
+            side = Side.LEFT if self.settings.ai_side == "left" else Side.RIGHT
+            delay, error = DIFFICULTIES[self.settings.ai_difficulty]
+            self.computer = ComputerPlayer(self.simulation, side, delay, error)
+
+        # Campo
+        self.playfield = Playfield(
+            self.screen,
+            self.settings,
+            [
+                (self.settings.wall_rgb, self.simulation.walls_rects),
+                (self.settings.goal_rgb, self.simulation.goals_rects),
+                (self.settings.dash_rgb, DashedLine(self.simulation.bounds, self.settings).get()),
+            ],
+        )
 
         # Sprites
-        self.top_wall = Wall(self.screen, Side.TOP, self.settings)
-        self.bottom_wall = Wall(self.screen, Side.BOTTOM, self.settings)
-        self.left_goal = Goal(self.screen, Side.LEFT, self.settings)
-        self.right_goal = Goal(self.screen, Side.RIGHT, self.settings)
-        self.left_paddle = Paddle(self.screen, Side.LEFT, self.settings)
-        self.right_paddle = Paddle(self.screen, Side.RIGHT, self.settings)
-        self.ball = Ball(self.screen, self.settings)
+        self.left_paddle = Paddle(self.simulation.left_paddle, self.simulation.state, self.settings)
+        self.right_paddle = Paddle(self.simulation.right_paddle, self.simulation.state, self.settings)
+        self.ball = Ball(self.simulation.ball, self.simulation.state, self.settings)
 
         # Sprites group
-        self.sprites = pygame.sprite.LayeredUpdates()
-        self.sprites.add(self.top_wall)
-        self.sprites.add(self.bottom_wall)
-        self.sprites.add(self.left_goal)
-        self.sprites.add(self.right_goal)
+        if self.settings.render_mode == "dirty":
+            self.sprites = pygame.sprite.LayeredDirty(_use_update=True, _time_threshold=math.inf)
+        else:
+            self.sprites = pygame.sprite.LayeredUpdates()
+
         self.sprites.add(self.left_paddle)
         self.sprites.add(self.right_paddle)
         self.sprites.add(self.ball)
-        self.sprites.add(DashedLine(self.screen, self.settings).get())
 
         # Sounds
-        self.start_sound = pygame.mixer.Sound(self.settings["start.sound"])
-        self.collision_sound = pygame.mixer.Sound(self.settings["collision.sound"])
-        self.collision_sound_cooldown = self.settings["collision.sound.cooldown"]
-        self.score_sound = pygame.mixer.Sound(self.settings["score.sound"])
-        self.winner_sound = pygame.mixer.Sound(self.settings["winner.sound"])
-        self.restart_sound = pygame.mixer.Sound(self.settings["restart.sound"])
-
-        # Channels
-        self.start_channel = pygame.mixer.Channel(1)
-        self.start_channel.set_volume(self.settings["sound.volume"])
-        self.collision_channel = pygame.mixer.Channel(2)
-        self.collision_channel.set_volume(self.settings["sound.volume"])
-        self.score_channel = pygame.mixer.Channel(3)
-        self.score_channel.set_volume(self.settings["sound.volume"])
-        self.winner_channel = pygame.mixer.Channel(4)
-        self.winner_channel.set_volume(self.settings["sound.volume"])
-        self.restart_channel = pygame.mixer.Channel(5)
-        self.restart_channel.set_volume(self.settings["sound.volume"])
+        self.collision_sound_cooldown = self.settings.collision_sound_cooldown
 
         # Score
-        self.score_font = pygame.font.Font(self.settings["font.family"], self.settings["game.score.font.size"])
-        self.left_score = 0
-        self.left_score_text = self.render_text(str(self.left_score), self.score_font)
-        self.right_score = 0
-        self.right_score_text = self.render_text(str(self.right_score), self.score_font)
+        self.score_font_size = self.settings.game_score_font_size
+        self.left_score_text = Text(
+            self.render_text(str(self.simulation.left_score), self.score_font_size),
+            self.settings.grid_x[3],
+            self.settings.grid_y[2],
+        )
+        self.right_score_text = Text(
+            self.render_text(str(self.simulation.right_score), self.score_font_size),
+            self.settings.grid_x[9],
+            self.settings.grid_y[2],
+        )
+        self.sprites.add(self.left_score_text)
+        self.sprites.add(self.right_score_text)
 
         # Winner
-        self.winner_font = pygame.font.Font(self.settings["font.family"], self.settings["game.winner.font.size"])
-        self.winner_text = self.render_text(self.settings["game.winner.text"], self.winner_font)
+        self.winner_font_size = self.settings.game_winner_font_size
+        self.winner_text = Text(
+            self.render_text(self.settings.game_winner_text, self.winner_font_size),
+            self.settings.grid_x[3],
+            self.settings.grid_y[7],
+        )
 
         # Options
-        self.option_font = pygame.font.Font(self.settings["font.family"], self.settings["game.option.font.size"])
-        self.restart_text = self.render_text(self.settings["submenu.restart.text"], self.option_font)
-        self.exit_text = self.render_text(self.settings["submenu.exit.text"], self.option_font)
+        self.option_font_size = self.settings.game_option_font_size
+        self.restart_text = Text(
+            self.render_text(self.settings.submenu_restart_text, self.option_font_size),
+            self.settings.grid_x[3],
+            self.settings.grid_y[9],
+        )
+        self.exit_text = Text(
+            self.render_text(self.settings.submenu_exit_text, self.option_font_size),
+            self.settings.grid_x[3],
+            self.settings.grid_y[10],
+        )
+        self.winner_texts = [self.winner_text, self.restart_text, self.exit_text]
+
+        self.full_redraw = True
+        self.background_key = None
+        self.recorder = None
+        self.running = True
 
-        # Paddles
-        self.paddles = [self.left_paddle, self.right_paddle]
-        self.paddles_rects = [self.left_paddle.rect, self.right_paddle.rect]
+    def reset(self, seed: int | None = None) -> None:
+        """Prepara uma nova partida na sessão existente, com uma nova semente se nenhuma for informada"""
+        self.simulation.reset(seed)
 
-        # Walls
-        self.walls = [self.top_wall, self.bottom_wall]
-        self.walls_rects = [self.top_wall.rect, self.bottom_wall.rect]
+        if self.computer is not None:
+            self.computer.reset()
 
-        # Goals
-        self.goals = [self.left_goal, self.right_goal]
-        self.goals_rects = [self.left_goal.rect, self.right_goal.rect]
+        if self.settings.record_directory:
+            self.recorder = Recorder(self.simulation)
 
-        self.accumulator = 0.0
-        self.time_step = 1.0 / (self.settings["game.fps"] * 2.0)
-        self.running = True
-        self.winner = None
+        self.keyboard.sync()
+        self.handle_goal()
+        self.sprites.remove(self.winner_texts)
+        self.collision_sound_cooldown = self.settings.collision_sound_cooldown
+        self.next_scene_name = self.scene_name
+        self.full_redraw = True
 
-    def process_events(self) -> None:
-        """Processa os eventos do jogo"""
-        keys = pygame.key.get_pressed()
-        self.left_paddle.update_direction(keys)
-        self.right_paddle.update_direction(keys)
+    def suspend(self) -> None:
+        """Suspende a sessão enquanto outra cena está ativa"""
+        self.audio.stop()
+
+        if self.recorder is not None:
+            self.save_recording()
+
+    def save_recording(self) -> None:
+        """Grava a partida atual no diretório de gravações"""
+        os.makedirs(self.settings.record_directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.recorder.seed}.rec"
+        self.recorder.save(os.path.join(self.settings.record_directory, name))
+        self.recorder.detach()
+        self.recorder = None
 
-        for event in pygame.event.get():
+    def process_events(self) -> None:
+        """Processa os eventos do jogo; as teclas das raquetes são aplicadas a cada passo da física"""
+        for event in self.keyboard.take():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
                     self.handle_restart()
@@ -109,136 +179,131 @@ class Game:
                     self.next_scene_name = Scene.MENU
             elif event.type == pygame.QUIT:
                 self.running = False
-            elif event.type == Event.START.value:
-                self.start_channel.play(self.start_sound)
 
     def play_collision_sound(self) -> None:
         """Reproduz o som de colisão"""
         if self.collision_sound_cooldown <= 0:
-            self.collision_channel.play(self.collision_sound)
-            self.collision_sound_cooldown = self.settings["collision.sound.cooldown"]
+            self.audio.play("collision.sound")
+            self.collision_sound_cooldown = self.settings.collision_sound_cooldown
 
-    def handle_goal(self, side: Side) -> None:
+    def handle_goal(self) -> None:
         """Gerencia a atualização do placar"""
-        if side == Side.LEFT:
-            self.right_score += 1
-            self.right_score_text = self.render_text(str(self.right_score), self.score_font)
-        elif side == Side.RIGHT:
-            self.left_score += 1
-            self.left_score_text = self.render_text(str(self.left_score), self.score_font)
-
-        if self.left_score >= self.settings["game.points.max"] or self.right_score >= self.settings["game.points.max"]:
-            self.handle_endgame()
-        else:
-            self.score_channel.play(self.score_sound)
-            self.ball.state = BallState.READY
+        self.left_score_text.set_image(self.render_text(str(self.simulation.left_score), self.score_font_size))
+        self.right_score_text.set_image(self.render_text(str(self.simulation.right_score), self.score_font_size))
 
     def handle_restart(self) -> None:
         """Gerencia o reinício do jogo"""
-        self.restart_channel.play(self.restart_sound)
-        self.left_score = 0
-        self.left_score_text = self.render_text(str(self.left_score), self.score_font)
-        self.right_score = 0
-        self.right_score_text = self.render_text(str(self.right_score), self.score_font)
-        self.ball.state = BallState.READY
-        self.winner = None
+        self.audio.play("restart.sound")
+        self.simulation.restart()
+        self.handle_goal()
+
+        if self.winner_text.alive():
+            self.sprites.remove(self.winner_texts)
+            self.full_redraw = True
 
     def handle_endgame(self) -> None:
-        """Gerencia o fim do jogo"""
-        self.winner_channel.play(self.winner_sound)
-        self.ball.state = BallState.WAITING
+        """Gerencia a apresentação do vencedor"""
+        if self.simulation.winner == Side.LEFT:
+            position = self.settings.grid_x[3]
+        elif self.simulation.winner == Side.RIGHT:
+            position = self.settings.grid_x[9]
 
-        if self.left_score > self.right_score:
-            self.winner = Side.LEFT
-        else:
-            self.winner = Side.RIGHT
+        for text in self.winner_texts:
+            text.place(position, text.y)
+
+        self.sprites.add(self.winner_texts)
+        self.full_redraw = True
 
     def process_logic(self, dt: float) -> None:
         """Processa a lógica do jogo"""
-        self.accumulator += dt
-
         if self.collision_sound_cooldown > 0:
             self.collision_sound_cooldown -= dt
 
-        while self.accumulator >= self.time_step:
-            self.sprites.update(self.time_step)
-
-            # Colisão com as raquetes
-            collided_paddle_index = self.ball.rect.collidelist(self.paddles_rects)
-
-            if collided_paddle_index != -1:
-                collided_paddle = self.paddles[collided_paddle_index]
-
-                if (self.ball.velocity.x > 0 and collided_paddle.side == Side.RIGHT) or (
-                    self.ball.velocity.x < 0 and collided_paddle.side == Side.LEFT
-                ):
-                    self.play_collision_sound()
-                    self.ball.velocity.x *= -1
-                    self.ball.stroke(self.ball.rect.centery - collided_paddle.rect.centery, collided_paddle.side)
-
-            # Colisão com as paredes
-            collided_wall_index = self.ball.rect.collidelist(self.walls_rects)
-
-            if collided_wall_index != -1:
-                collided_wall = self.walls[collided_wall_index]
-
-                if (self.ball.velocity.y > 0 and collided_wall.side == Side.BOTTOM) or (
-                    self.ball.velocity.y < 0 and collided_wall.side == Side.TOP
-                ):
-                    self.play_collision_sound()
-                    self.ball.velocity.y *= -1
-
-            # Colisão com os gols
-            collided_goal_index = self.ball.rect.collidelist(self.goals_rects)
-
-            if collided_goal_index != -1 and self.ball.state == BallState.RUNNING:
-                collided_goal = self.goals[collided_goal_index]
-                self.handle_goal(collided_goal.side)
-
-            self.accumulator -= self.time_step
-
-    def process_frames(self) -> None:
-        """Processa os frames do jogo"""
-        self.screen.fill(pygame.color.THECOLORS[self.settings["screen.color"]])
-
-        # Left score
-        self.show_text(
-            self.left_score_text,
-            self.settings["screen.grid.width.03.12"],
-            self.settings["screen.grid.height.02.12"],
-        )
-
-        # Right score
-        self.show_text(
-            self.right_score_text,
-            self.settings["screen.grid.width.09.12"],
-            self.settings["screen.grid.height.02.12"],
-        )
-
-        if self.winner is not None:
-            if self.winner == Side.LEFT:
-                position = self.settings["screen.grid.width.03.12"]
-            elif self.winner == Side.RIGHT:
-                position = self.settings["screen.grid.width.09.12"]
-
-            self.show_text(self.winner_text, position, self.settings["screen.grid.height.07.12"])
-            self.show_text(self.restart_text, position, self.settings["screen.grid.height.09.12"])
-            self.show_text(
-                self.exit_text,
-                position,
-                self.settings["screen.grid.height.10.12"],
-            )
-
-        self.sprites.draw(self.screen)
-        pygame.display.flip()
-
-    def render_text(self, text: str, font: pygame.font.Font) -> pygame.surface.Surface:
+        # O último passo deste quadro termina agora; cada passo anterior, um passo antes
+        self.step_time = self.keyboard.clock() - self.simulation.accumulator - dt
+        self.simulation.advance(dt, self.sample)
+        self.handle_events()
+
+    def sample(self, dt: float) -> None:
+        """Aplica as teclas e o jogador do computador antes de um passo da física com a duração informada"""
+        self.step_time += dt
+
+        if self.keyboard.active:
+            self.keyboard.apply(self.step_time)
+
+            for side in [Side.LEFT, Side.RIGHT]:
+                if self.computer is None or self.computer.side != side:
+                    self.simulation.set_direction(side, *self.keyboard.directions[side.value])
+
+        if self.computer is not None:
+            self.computer.play(dt)
+
+    def handle_events(self) -> None:
+        """Reproduz os sons e atualiza os textos a partir dos eventos da simulação"""
+        for event in self.simulation.events:
+            if event == Event.START:
+                self.audio.play("start.sound")
+            elif event == Event.COLLISION:
+                self.play_collision_sound()
+            elif event == Event.SCORE:
+                self.audio.play("score.sound")
+                self.handle_goal()
+            elif event == Event.WINNER:
+                self.audio.play("winner.sound")
+                self.handle_goal()
+                self.handle_endgame()
+
+    def process_frames(self) -> list[pygame.Rect] | None:
+        """Processa os frames do jogo e retorna as áreas alteradas, ou None se foi a tela inteira"""
+        background = self.playfield.get()
+        self.sprites.update()
+
+        if self.settings.render_mode == "dirty":
+            if self.full_redraw or self.background_key != self.playfield.key:
+                self.background_key = self.playfield.key
+                self.sprites.clear(self.screen, background)
+                self.sprites.repaint_rect(self.screen.get_rect())
+                self.full_redraw = False
+
+            # As bolas extras não são sprites: o grupo repinta o fundo e os sprites onde elas estavam
+            for rect in self.multiball_rects:
+                self.sprites.repaint_rect(rect)
+
+            rects = self.sprites.draw(self.screen)
+
+            if self.multiball is not None:
+                rects.extend(self.multiball_rects)
+                rects.extend(self.draw_multiball())
+
+            return rects
+        else:
+            self.screen.blit(background, (0, 0))
+            self.sprites.draw(self.screen)
+
+            if self.multiball is not None:
+                self.draw_multiball()
+
+            return None
+
+    def draw_multiball(self) -> list[pygame.Rect]:
+        """Desenha as bolas extras por cima dos sprites e retorna as áreas ocupadas por elas"""
+        multiball = self.multiball
+        x = multiball.balls.ball_x
+        y = multiball.balls.ball_y
+
+        if self.ball.interpolation:
+            alpha = self.simulation.accumulator / self.settings.time_step
+            x = multiball.previous_x + (x - multiball.previous_x) * alpha
+            y = multiball.previous_y + (y - multiball.previous_y) * alpha
+
+        x = np.rint(x * self.view.scale_x).astype(np.int64).tolist()
+        y = np.rint(y * self.view.scale_y).astype(np.int64).tolist()
+        image = self.ball.image
+        self.screen.blits([(image, position) for position in zip(x, y)], doreturn=False)
+        size = image.get_size()
+        self.multiball_rects = [pygame.Rect(position, size) for position in zip(x, y)]
+        return self.multiball_rects
+
+    def render_text(self, text: str, size: int) -> pygame.surface.Surface:
         """Renderiza o texto"""
-        return font.render(text, True, pygame.color.THECOLORS[self.settings["font.color"]])
-
-    def show_text(self, text: pygame.surface.Surface, x: float, y: float) -> None:
-        """Apresenta o texto"""
-        rect = text.get_rect()
-        rect.centerx = round(self.screen.get_rect().width * x)
-        rect.centery = round(self.screen.get_rect().height * y)
-        self.screen.blit(text, rect)
+        return self.text_cache.render(text, self.settings.font_family, self.view.font_size(size), self.settings.font_rgb)
@@ -0,0 +1,98 @@
+# keyboard.py
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+import pygame
+from settings import Settings
+from side import Side
+
+# Tipos de evento que entram na fila; o resto é descartado pelo SDL antes de chegar ao jogo
+EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP]
+
+# Teclas das raquetes: lado e direção (0 para cima, 1 para baixo)
+BINDINGS = {
+    pygame.K_w: (Side.LEFT.value, 0),
+    pygame.K_s: (Side.LEFT.value, 1),
+    pygame.K_UP: (Side.RIGHT.value, 0),
+    pygame.K_DOWN: (Side.RIGHT.value, 1),
+}
+
+
+class Keyboard:
+    """Define a leitura do teclado com a hora de cada tecla, aplicada no passo da física correspondente"""
+
+    def __init__(self, settings: Settings, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Inicializa o teclado sem teclas pressionadas"""
+        self.settings = settings
+        self.clock = clock
+        self.active = False
+        self.events: list[pygame.event.Event] = []
+        self.transitions: deque[tuple[float, int, int, bool]] = deque(maxlen=256)
+        self.directions = [[False, False], [False, False]]
+
+        # Latência entre a tecla e a apresentação do quadro que mostra o movimento
+        self.pending: list[float] = []
+        self.latencies: deque[float] = deque(maxlen=self.settings.profiler_capacity)
+
+    def poll(self) -> None:
+        """Tira os eventos da fila do SDL, marcando nas teclas das raquetes a hora em que foram lidos"""
+        self.active = True
+        now = self.clock()
+
+        for event in pygame.event.get():
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in BINDINGS:
+                side, direction = BINDINGS[event.key]
+                self.transitions.append((now, side, direction, event.type == pygame.KEYDOWN))
+
+            self.events.append(event)
+
+    def take(self) -> list[pygame.event.Event]:
+        """Retorna os eventos lidos desde a última vez, para a cena tratar"""
+        self.poll()
+        events = self.events
+        self.events = []
+        return events
+
+    def sync(self) -> None:
+        """Descarta as teclas ainda não aplicadas e parte do estado atual do teclado"""
+        # Sem leituras ainda, como nas sessões sem tela, não há teclado a consultar
+        if not self.active:
+            return
+
+        keys = pygame.key.get_pressed()
+        self.transitions.clear()
+        self.pending.clear()
+
+        for key, (side, direction) in BINDINGS.items():
+            self.directions[side][direction] = bool(keys[key])
+
+    def apply(self, until: float) -> None:
+        """Aplica as teclas lidas até a hora informada, a do próximo passo da física"""
+        while self.transitions and self.transitions[0][0] <= until:
+            moment, side, direction, pressed = self.transitions.popleft()
+            self.directions[side][direction] = pressed
+
+            if pressed:
+                self.pending.append(moment)
+
+    def presented(self) -> None:
+        """Registra a latência das teclas aplicadas, agora que o quadro com o movimento foi apresentado"""
+        if not self.pending:
+            return
+
+        now = self.clock()
+        self.latencies.extend(now - moment for moment in self.pending)
+        self.pending.clear()
+
+    def stats(self) -> dict:
+        """Retorna a latência da tecla até a tela, em milissegundos"""
+        if not self.latencies:
+            return {"presses": 0, "latency_ms": 0.0, "latency_ms_max": 0.0}
+
+        return {
+            "presses": len(self.latencies),
+            "latency_ms": sum(self.latencies) / len(self.latencies) * 1000,
+            "latency_ms_max": max(self.latencies) * 1000,
+        }
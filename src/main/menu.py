@@ -1,52 +1,73 @@
 # menu.py
 
 import pygame
+from audio import Audio
+from keyboard import Keyboard
 from scene import Scene
+from settings import Settings
+from text_cache import TextCache
+from view import View
 
 
 class Menu:
     """Define o menu"""
 
-    def __init__(self, screen: pygame.surface.Surface, settings: dict) -> None:
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        settings: Settings,
+        text_cache: TextCache,
+        audio: Audio,
+        keyboard: Keyboard | None = None,
+    ) -> None:
         """Inicializa o menu"""
         self.settings = settings
         self.scene_name = Scene.MENU
         self.next_scene_name = Scene.MENU
         self.screen = screen
-
-        # Music
-        pygame.mixer.music.load(self.settings["background.music"])
-        pygame.mixer.music.set_volume(self.settings["music.volume"])
-        pygame.mixer.music.play(-1)
-
-        # Sound
-        self.restart_sound = pygame.mixer.Sound(self.settings["restart.sound"])
-
-        # Channels
-        self.menu_channel = pygame.mixer.Channel(0)
-        self.menu_channel.set_volume(self.settings["sound.volume"])
+        self.text_cache = text_cache
+        self.audio = audio
+        self.keyboard = keyboard if keyboard is not None else Keyboard(settings)
+        self.view = View(self.settings)
 
         # Title
-        self.title_font = pygame.font.Font(self.settings["font.family"], self.settings["menu.title.font.size"])
-        self.title_text = self.render_text(self.settings["menu.title.text"], self.title_font)
+        self.title_font_size = self.settings.menu_title_font_size
+        self.title_text = self.render_text(self.settings.menu_title_text, self.title_font_size)
 
         # Options
-        self.option_font = pygame.font.Font(self.settings["font.family"], self.settings["menu.option.font.size"])
-        self.start_text = self.render_text(self.settings["menu.start.text"], self.option_font)
-        self.exit_text = self.render_text(self.settings["menu.exit.text"], self.option_font)
+        self.option_font_size = self.settings.menu_option_font_size
+        self.start_text = self.render_text(self.settings.menu_start_text, self.option_font_size)
+        self.online_text = self.render_text(self.settings.menu_online_text, self.option_font_size)
+        self.exit_text = self.render_text(self.settings.menu_exit_text, self.option_font_size)
+        self.online = bool(self.settings.net_remote_host)
 
+        self.full_redraw = True
         self.running = True
 
+    def reset(self) -> None:
+        """Prepara o menu para ser apresentado novamente"""
+        self.audio.play_music()
+        self.next_scene_name = self.scene_name
+        self.full_redraw = True
+
+    def suspend(self) -> None:
+        """Suspende o menu enquanto outra cena está ativa"""
+        self.audio.stop_music()
+
     def process_events(self) -> None:
         """Processa os eventos do menu"""
-        for event in pygame.event.get():
+        for event in self.keyboard.take():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     pygame.event.post(pygame.event.Event(pygame.QUIT))
                 elif event.key == pygame.K_RETURN:
-                    pygame.mixer.music.stop()
-                    self.menu_channel.play(self.restart_sound)
+                    self.audio.stop_music()
+                    self.audio.play("restart.sound")
                     self.next_scene_name = Scene.GAME
+                elif event.key == pygame.K_n and self.online:
+                    self.audio.stop_music()
+                    self.audio.play("restart.sound")
+                    self.next_scene_name = Scene.ONLINE
             elif event.type == pygame.QUIT:
                 self.running = False
 
@@ -54,29 +75,39 @@ class Menu:
         """Processa a lógica do menu"""
         pass
 
-    def process_frames(self) -> None:
-        """Processa os frames do menu"""
-        self.screen.fill(self.settings["screen.color"])
+    def process_frames(self) -> list[pygame.Rect] | None:
+        """Processa os frames do menu e retorna as áreas alteradas, ou None se foi a tela inteira"""
+        if self.settings.render_mode == "dirty" and not self.full_redraw:
+            return []
+
+        self.full_redraw = False
+        self.screen.fill(self.settings.screen_rgb)
 
         # Título
         title_text_rect = self.title_text.get_rect()
         title_text_rect.centerx = self.screen.get_rect().centerx
-        title_text_rect.centery = round(self.screen.get_rect().bottom * self.settings["screen.grid.height.04.12"])
+        title_text_rect.centery = self.settings.grid_y[4]
         self.screen.blit(self.title_text, title_text_rect)
 
         # Opções
         start_text_rect = self.start_text.get_rect()
         start_text_rect.centerx = self.screen.get_rect().centerx
-        start_text_rect.centery = round(self.screen.get_rect().bottom * self.settings["screen.grid.height.07.12"])
+        start_text_rect.centery = self.settings.grid_y[7]
         self.screen.blit(self.start_text, start_text_rect)
 
+        if self.online:
+            online_text_rect = self.online_text.get_rect()
+            online_text_rect.centerx = self.screen.get_rect().centerx
+            online_text_rect.centery = self.settings.grid_y[8]
+            self.screen.blit(self.online_text, online_text_rect)
+
         exit_text_rect = self.exit_text.get_rect()
         exit_text_rect.centerx = self.screen.get_rect().centerx
-        exit_text_rect.centery = round(self.screen.get_rect().bottom * self.settings["screen.grid.height.08.12"])
+        exit_text_rect.centery = self.settings.grid_y[9 if self.online else 8]
         self.screen.blit(self.exit_text, exit_text_rect)
 
-        pygame.display.flip()
+        return None
 
-    def render_text(self, text: str, font: pygame.font.Font) -> pygame.surface.Surface:
+    def render_text(self, text: str, size: int) -> pygame.surface.Surface:
         """Rederiza o texto"""
-        return font.render(text, True, self.settings["font.color"])
+        return self.text_cache.render(text, self.settings.font_family, self.view.font_size(size), self.settings.font_rgb)
@@ -0,0 +1,188 @@
+# multiball.py
+
+import numpy as np
+from ball_state import BallState
+from batch_simulation import BatchSimulation
+from event import Event
+from side import Side
+from simulation import Simulation
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y, SCORE
+
+LEFT = Side.LEFT.value
+RIGHT = Side.RIGHT.value
+RUNNING = BallState.RUNNING.value
+
+# Células vizinhas visitadas a partir de cada célula; a outra metade é visitada a partir das vizinhas
+NEIGHBOURS = [(0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+class Multiball:
+    """Define as bolas extras do modo festa, que dividem as raquetes e o placar com a simulação"""
+
+    def __init__(self, simulation: Simulation) -> None:
+        """Inicializa as bolas extras e as associa à simulação"""
+        self.simulation = simulation
+        self.settings = simulation.settings
+        self.count = self.settings.ball_count - 1
+        self.collisions = self.settings.ball_collisions
+        self.size = self.settings.ball_size
+
+        # Estado compacto, em vetores, com cada bola como uma partida do lote que usa as raquetes da simulação
+        self.balls = BatchSimulation(simulation.bounds, self.settings, self.count)
+        self.previous_x = np.zeros(self.count, dtype=np.int64)
+        self.previous_y = np.zeros(self.count, dtype=np.int64)
+
+        # Grade uniforme com células do dobro da bola: bolas que se tocam estão em células vizinhas
+        self.cell = self.size * 2
+        self.columns = simulation.bounds.width // self.cell + 1
+        self.rows = simulation.bounds.height // self.cell + 1
+        self.pairs = 0
+        self.contacts = 0
+
+        self.simulation.multiball = self
+        self.reset()
+
+    def reset(self) -> None:
+        """Recoloca todas as bolas extras à espera do saque, com sorteios que dependem da semente da partida"""
+        self.balls.random = np.random.default_rng(self.simulation.draw().getrandbits(64))
+        self.balls.reset()
+
+        # Os primeiros saques são espalhados pelo tempo de espera, para as bolas entrarem aos poucos
+        self.balls.ball_accumulator[:] = -self.settings.ball_ready_time_play * np.arange(1, self.count + 1) / self.count
+        self.previous_x[:] = self.balls.ball_x
+        self.previous_y[:] = self.balls.ball_y
+
+    def step(self) -> None:
+        """Avança as bolas extras em um passo fixo, depois da bola da simulação"""
+        values = self.simulation.state.values
+        balls = self.balls
+        self.previous_x[:] = balls.ball_x
+        self.previous_y[:] = balls.ball_y
+
+        # As raquetes já andaram neste passo; no lote elas ficam paradas onde estão
+        balls.paddles_y[:, LEFT] = values[PADDLE_Y[LEFT]]
+        balls.paddles_y[:, RIGHT] = values[PADDLE_Y[RIGHT]]
+        balls.paddles_vy[:] = 0.0
+        balls.scores[:] = 0
+        balls.step()
+
+        collided = balls.stroked.any() or balls.bounced.any()
+
+        if self.collisions:
+            collided = self.collide() or collided
+
+        # Um único evento por passo, por mais bolas que batam, para não inundar o canal de som
+        if collided:
+            self.simulation.events.append(Event.COLLISION)
+
+        if (balls.scored >= 0).any():
+            self.handle_goals()
+
+    def handle_goals(self) -> None:
+        """Soma ao placar da simulação os gols das bolas extras"""
+        values = self.simulation.state.values
+        goals = self.balls.scored[self.balls.scored >= 0]
+
+        # Os gols do mesmo passo contam na ordem das bolas até alguém chegar ao máximo de pontos
+        left = values[SCORE[LEFT]] + np.cumsum(goals == RIGHT)
+        right = values[SCORE[RIGHT]] + np.cumsum(goals == LEFT)
+        ended = np.flatnonzero(np.maximum(left, right) >= self.settings.game_points_max)
+        last = ended[0] if len(ended) else len(goals) - 1
+        values[SCORE[LEFT]] = left[last]
+        values[SCORE[RIGHT]] = right[last]
+
+        if len(ended):
+            self.simulation.handle_endgame()
+        else:
+            self.simulation.events.append(Event.SCORE)
+
+    def collide(self) -> bool:
+        """Troca as velocidades das bolas que se tocam, inclusive a da simulação, e indica se houve contato"""
+        values = self.simulation.state.values
+        balls = self.balls
+        x = np.append(balls.ball_x, values[BALL_X])
+        y = np.append(balls.ball_y, values[BALL_Y])
+        vx = np.append(balls.ball_vx, values[BALL_VX])
+        vy = np.append(balls.ball_vy, values[BALL_VY])
+        running = np.append(balls.ball_state == RUNNING, values[BALL_STATE] == RUNNING)
+        first, second = self.find_pairs(x, y, np.flatnonzero(running))
+        self.pairs = len(first)
+
+        dx = x[second] - x[first]
+        dy = y[second] - y[first]
+        touching = (np.abs(dx) < self.size) & (np.abs(dy) < self.size)
+
+        # Bolas iguais trocam a velocidade na direção do contato, a de menor sobreposição, se estão se aproximando
+        horizontal = np.abs(dx) >= np.abs(dy)
+        swap_x = touching & horizontal & ((vx[second] - vx[first]) * dx < 0)
+        swap_y = touching & ~horizontal & ((vy[second] - vy[first]) * dy < 0)
+
+        # Cada bola troca com uma só outra por passo; os demais contatos dela ficam para o passo seguinte
+        contact = swap_x | swap_y
+        ends = np.stack([first, second], axis=1)
+        ends[~contact] = -1
+        seen = np.zeros(ends.size, dtype=bool)
+        seen[np.unique(ends.ravel(), return_index=True)[1]] = True
+        chosen = contact & seen.reshape(-1, 2).all(axis=1)
+        swap_x &= chosen
+        swap_y &= chosen
+
+        vx[first[swap_x]], vx[second[swap_x]] = vx[second[swap_x]], vx[first[swap_x]]
+        vy[first[swap_y]], vy[second[swap_y]] = vy[second[swap_y]], vy[first[swap_y]]
+        self.contacts = int(np.count_nonzero(chosen))
+
+        if self.contacts == 0:
+            return False
+
+        balls.ball_vx[:] = vx[:-1]
+        balls.ball_vy[:] = vy[:-1]
+        values[BALL_VX] = vx[-1]
+        values[BALL_VY] = vy[-1]
+        return True
+
+    def find_pairs(self, x: np.ndarray, y: np.ndarray, index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Retorna os pares de bolas em células vizinhas da grade, cada par uma única vez"""
+        column = np.clip(x[index] // self.cell, 0, self.columns - 1).astype(np.int64)
+        row = np.clip(y[index] // self.cell, 0, self.rows - 1).astype(np.int64)
+        keys = row * self.columns + column
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        owners = np.arange(len(index))
+        firsts = []
+        seconds = []
+
+        for dx, dy in NEIGHBOURS:
+            valid = (column + dx >= 0) & (column + dx < self.columns) & (row + dy < self.rows)
+            targets = (row + dy) * self.columns + column + dx
+            start = np.searchsorted(sorted_keys, targets, "left")
+            counts = np.where(valid, np.searchsorted(sorted_keys, targets, "right") - start, 0)
+            total = int(counts.sum())
+
+            if total == 0:
+                continue
+
+            # Expande cada bola nas bolas da célula vizinha, que estão contíguas na ordem das chaves
+            first = np.repeat(owners, counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            second = order[np.repeat(start, counts) + offsets]
+
+            if (dx, dy) == (0, 0):
+                keep = first < second
+                first = first[keep]
+                second = second[keep]
+
+            firsts.append(first)
+            seconds.append(second)
+
+        if not firsts:
+            return index[:0], index[:0]
+
+        return index[np.concatenate(firsts)], index[np.concatenate(seconds)]
+
+    def stats(self) -> dict:
+        """Retorna o número de bolas em jogo e os pares verificados e contatos do último passo"""
+        return {
+            "balls": int(np.count_nonzero(self.balls.ball_state == RUNNING)),
+            "pairs": self.pairs,
+            "contacts": self.contacts,
+        }
@@ -0,0 +1,171 @@
+# online_game.py
+
+import pygame
+from audio import Audio
+from keyboard import Keyboard
+from peer import Peer
+from rollback import DOWN, RESTART, UP, Rollback
+from scene import Scene
+from settings import Settings
+from side import Side
+from text import Text
+from text_cache import TextCache
+
+from game import Game
+
+
+class OnlineGame(Game):
+    """Define uma sessão do jogo em rede, em que cada jogador controla uma raquete"""
+
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        settings: Settings,
+        text_cache: TextCache,
+        audio: Audio,
+        keyboard: Keyboard | None = None,
+    ) -> None:
+        """Inicializa uma sessão do jogo em rede"""
+        super().__init__(screen, settings, text_cache, audio, keyboard)
+        self.scene_name = Scene.ONLINE
+        self.next_scene_name = Scene.ONLINE
+        self.side = Side.LEFT if self.settings.net_side == "left" else Side.RIGHT
+        self.rollback = Rollback(self.simulation, self.side)
+        self.computer = None
+
+        # A sessão avança a simulação por passos, sem tempo acumulado para interpolar
+        for sprite in [self.ball, self.left_paddle, self.right_paddle]:
+            sprite.interpolation = False
+
+        self.peer = None
+        self.started = False
+        self.restart = False
+        self.frame_time = 1.0 / self.settings.game_fps
+        self.elapsed = 0.0
+        self.shown = (0, 0, None)
+        self.waiting_text = Text(
+            self.render_text(self.settings.net_waiting_text, self.option_font_size),
+            self.settings.grid_x[6],
+            self.settings.grid_y[7],
+        )
+
+    def reset(self) -> None:
+        """Abre a conexão e aguarda o outro jogador para começar uma nova partida"""
+        super().reset()
+
+        if self.recorder is not None:
+            self.recorder.detach()
+            self.recorder = None
+
+        self.peer = Peer(
+            self.settings,
+            self.settings.net_local_port,
+            (self.settings.net_remote_host, self.settings.net_remote_port),
+        )
+        self.rollback.start(self.simulation.seed if self.side == Side.LEFT else 0)
+        self.started = False
+        self.restart = False
+        self.elapsed = 0.0
+        self.shown = (0, 0, None)
+        self.sprites.add(self.waiting_text)
+
+    def suspend(self) -> None:
+        """Fecha a conexão enquanto outra cena está ativa"""
+        super().suspend()
+
+        if self.peer is not None:
+            self.peer.close()
+            self.peer = None
+
+    def process_events(self) -> None:
+        """Processa os eventos do jogo em rede"""
+        for event in self.keyboard.take():
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    self.restart = True
+                elif event.key == pygame.K_ESCAPE:
+                    self.next_scene_name = Scene.MENU
+            elif event.type == pygame.QUIT:
+                self.running = False
+
+    def read_input(self) -> int:
+        """Lê a entrada local do jogador, com qualquer um dos dois conjuntos de teclas"""
+        self.keyboard.apply(self.keyboard.clock())
+        left, right = self.keyboard.directions
+        bits = 0
+
+        if left[0] or right[0]:
+            bits |= UP
+
+        if left[1] or right[1]:
+            bits |= DOWN
+
+        if self.restart:
+            bits |= RESTART
+            self.restart = False
+            self.audio.play("restart.sound")
+
+        return bits
+
+    def receive(self) -> None:
+        """Entrega à sessão as entradas recebidas, começando a partida no primeiro contato"""
+        for seed, ack, first, inputs in self.peer.receive():
+            if self.side == Side.RIGHT and seed != self.rollback.simulation.seed:
+                self.rollback.start(seed)
+                self.started = False
+            elif self.side == Side.LEFT and seed != self.rollback.simulation.seed:
+                continue
+
+            if not self.started:
+                self.started = True
+                self.elapsed = 0.0
+                self.sprites.remove(self.waiting_text)
+                self.full_redraw = True
+
+            self.rollback.add_remote_inputs(ack, first, inputs)
+
+    def send(self) -> None:
+        """Envia as entradas locais ainda não confirmadas"""
+        first, inputs = self.rollback.pending_inputs()
+        self.peer.send(self.rollback.simulation.seed, len(self.rollback.remote), first, inputs)
+
+    def process_logic(self, dt: float) -> None:
+        """Processa a lógica do jogo em rede em quadros fixos, com rollback quando a entrada remota diverge"""
+        if self.collision_sound_cooldown > 0:
+            self.collision_sound_cooldown -= dt
+
+        self.receive()
+
+        steps = self.rollback.steps
+
+        if self.started:
+            self.elapsed = min(self.elapsed + dt, self.frame_time * self.rollback.window)
+            events = []
+
+            while self.elapsed >= self.frame_time and self.rollback.advance(self.read_input()):
+                self.elapsed -= self.frame_time
+                events.extend(self.simulation.events)
+
+            self.simulation.events[:] = events
+            self.handle_events()
+            self.handle_rollback()
+
+        # Inclui os passos ressimulados, para que o perfilador mostre o custo real do quadro
+        self.simulation.substeps = self.rollback.steps - steps
+        self.send()
+
+    def handle_rollback(self) -> None:
+        """Corrige o placar e o vencedor mostrados quando um rollback os alterou"""
+        shown = (self.simulation.left_score, self.simulation.right_score, self.simulation.winner)
+
+        if shown == self.shown:
+            return
+
+        self.shown = shown
+        self.handle_goal()
+
+        if self.simulation.winner is None and self.winner_text.alive():
+            self.sprites.remove(self.winner_texts)
+            self.full_redraw = True
+        elif self.simulation.winner is not None and not self.winner_text.alive():
+            self.handle_endgame()
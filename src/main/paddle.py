@@ -1,73 +1,38 @@
 # paddle.py
 
 import pygame
-from side import Side
+from body import Body
+from settings import Settings
+from state import ACCUMULATOR, PADDLE_Y, PREVIOUS_PADDLE_Y, State
+from view import View
 
 
-class Paddle(pygame.sprite.Sprite):
+class Paddle(pygame.sprite.DirtySprite):
     """Define uma instância de uma raquete"""
 
-    def __init__(self, screen: pygame.surface.Surface, side: Side, settings: dict) -> None:
+    def __init__(self, body: Body, state: State, settings: Settings) -> None:
         """Inicializa uma instância de uma raquete"""
         super().__init__()
         self.settings = settings
         self._layer = 2
-        self.screen = screen
-        self.image = pygame.surface.Surface((self.settings["paddle.width"], self.settings["paddle.height"]))
-        self.image.fill(pygame.color.THECOLORS[self.settings["paddle.color"]])
-        self.rect = self.image.get_rect()
-        self.side = side
-        self.velocity = pygame.Vector2()
-        self.acceleration = self.settings["paddle.acceleration"]
-
-        if side == Side.LEFT:
-            self.rect.left = self.screen.get_rect().left + (self.rect.width * 3)
-            self.rect.centery = self.screen.get_rect().centery
-        elif side == Side.RIGHT:
-            self.rect.right = self.screen.get_rect().right - (self.rect.width * 3)
-            self.rect.centery = self.screen.get_rect().centery
-
-    def update(self, dt: float) -> None:
-        """Atualiza o estado de uma raquete"""
-        changey = round(self.velocity.y * dt)
-
-        paddle_top = self.rect.top + changey
-        paddle_bottom = self.rect.bottom + changey
-
-        if (
-            paddle_top >= self.screen.get_rect().top + self.settings["wall.size"]
-            and paddle_bottom <= self.screen.get_rect().bottom - self.settings["wall.size"]
-        ):
-            self.rect.centery += changey
-        else:
-            if self.velocity.y < 0:
-                self.rect.top = self.screen.get_rect().top + self.settings["wall.size"]
-            elif self.velocity.y > 0:
-                self.rect.bottom = self.screen.get_rect().bottom - self.settings["wall.size"]
-
-    def update_direction(self, keys: pygame.key.ScancodeWrapper) -> None:
-        """Atualiza a direção de uma raquete"""
-        if self.side == Side.LEFT:
-            self.process_interaction(keys, pygame.K_w, pygame.K_s)
-        elif self.side == Side.RIGHT:
-            self.process_interaction(keys, pygame.K_UP, pygame.K_DOWN)
-
-    def process_interaction(self, keys: pygame.key.ScancodeWrapper, key_up: int, key_down: int) -> None:
-        """Processa a interação do jogador com a raquete"""
-        if keys[key_down] and not keys[key_up]:
-            if self.velocity.y > 0:
-                self.acceleration += self.settings["paddle.acceleration.increment"]
-            else:
-                self.acceleration = self.settings["paddle.acceleration"]
-
-            self.velocity = pygame.Vector2(0, self.settings["paddle.speed"] * self.acceleration)
-        elif keys[key_up] and not keys[key_down]:
-            if self.velocity.y < 0:
-                self.acceleration += self.settings["paddle.acceleration.increment"]
-            else:
-                self.acceleration = self.settings["paddle.acceleration"]
-
-            self.velocity = pygame.Vector2(0, (self.settings["paddle.speed"] * self.acceleration) * -1)
+        self.dirty = 2
+        self.state = state
+        self.interpolation = self.settings.render_interpolation
+        self.side = body.side
+        self.position = PADDLE_Y[self.side.value]
+        self.previous = PREVIOUS_PADDLE_Y[self.side.value]
+        self.view = View(self.settings)
+        self.rect = self.view.rect(body.rect)
+        self.image = pygame.surface.Surface(self.rect.size)
+        self.image.fill(self.settings.paddle_rgb)
+        self.update()
+
+    def update(self) -> None:
+        """Posiciona a raquete a partir do bloco de estado, interpolando entre os dois últimos passos se configurado"""
+        values = self.state.values
+
+        if self.interpolation:
+            alpha = values[ACCUMULATOR] / self.settings.time_step
+            self.rect.y = self.view.y(values[self.previous] + (values[self.position] - values[self.previous]) * alpha)
         else:
-            self.velocity = pygame.Vector2()
-            self.acceleration = self.settings["paddle.acceleration"]
+            self.rect.y = self.view.y(values[self.position])
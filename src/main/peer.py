@@ -0,0 +1,82 @@
+# peer.py
+
+import heapq
+import random
+import socket
+import struct
+import time
+
+from settings import Settings
+
+MAGIC = b"PONGNET1"
+PACKET = struct.Struct("<8sQII")
+SIZE_MAX = 1024
+
+
+class Peer:
+    """Define o transporte UDP das entradas entre dois jogadores, com atraso e perda artificiais opcionais"""
+
+    def __init__(self, settings: Settings, local_port: int, remote: tuple[str, int]) -> None:
+        """Inicializa o transporte e abre o socket na porta local"""
+        self.settings = settings
+        self.remote = remote
+        self.random = random.Random()
+        self.outgoing: list[tuple[float, int, bytes]] = []
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.socket.bind(("", local_port))
+
+    def send(self, seed: int, ack: int, first: int, inputs: bytes) -> None:
+        """Envia as entradas locais a partir do quadro informado, com a confirmação das entradas remotas"""
+        packet = PACKET.pack(MAGIC, seed, ack, first) + inputs[: SIZE_MAX - PACKET.size]
+        self.sent += 1
+
+        if self.random.random() < self.settings.net_loss:
+            self.dropped += 1
+            return
+
+        delay = self.settings.net_latency + self.random.uniform(0.0, self.settings.net_jitter)
+        heapq.heappush(self.outgoing, (time.perf_counter() + delay, self.sent, packet))
+        self.pump()
+
+    def pump(self) -> None:
+        """Transmite os pacotes cujo atraso artificial já passou"""
+        now = time.perf_counter()
+
+        while self.outgoing and self.outgoing[0][0] <= now:
+            _, _, packet = heapq.heappop(self.outgoing)
+
+            try:
+                self.socket.sendto(packet, self.remote)
+            except OSError:
+                self.dropped += 1
+
+    def receive(self) -> list[tuple[int, int, int, bytes]]:
+        """Retorna os pacotes recebidos desde a última leitura como semente, confirmação, quadro e entradas"""
+        self.pump()
+        packets = []
+
+        while True:
+            try:
+                data = self.socket.recv(SIZE_MAX)
+            except (BlockingIOError, ConnectionError):
+                break
+
+            if len(data) < PACKET.size:
+                continue
+
+            magic, seed, ack, first = PACKET.unpack_from(data)
+
+            if magic == MAGIC:
+                self.received += 1
+                packets.append((seed, ack, first, data[PACKET.size :]))
+
+        return packets
+
+    def close(self) -> None:
+        """Fecha o socket"""
+        self.outgoing.clear()
+        self.socket.close()
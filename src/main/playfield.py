@@ -0,0 +1,43 @@
+# playfield.py
+
+import pygame
+from settings import Settings
+from view import View
+
+
+class Playfield:
+    """Define a camada estática do campo, pré-composta em uma superfície"""
+
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        settings: Settings,
+        layers: list[tuple[tuple[int, int, int, int], list[pygame.Rect]]],
+    ) -> None:
+        """Inicializa a camada estática do campo"""
+        self.settings = settings
+        self.screen = screen
+        self.layers = layers
+        self.view = View(self.settings)
+        self.surface = pygame.surface.Surface(self.screen.get_size())
+        self.key = None
+
+    def get(self) -> pygame.surface.Surface:
+        """Retorna a superfície do campo, compondo-a no primeiro uso"""
+        # As áreas das camadas são fixas, calculadas para o tamanho da tela na criação da cena
+        if self.key is None:
+            self.build()
+            self.key = self.screen.get_size()
+
+        return self.surface
+
+    def build(self) -> None:
+        """Compõe as camadas estáticas na superfície do campo, na resolução interna"""
+        if self.surface.get_size() != self.screen.get_size():
+            self.surface = pygame.surface.Surface(self.screen.get_size())
+
+        self.surface.fill(self.settings.screen_rgb)
+
+        for color, rects in self.layers:
+            for rect in rects:
+                self.surface.fill(color, self.view.rect(rect))
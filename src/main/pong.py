@@ -1,12 +1,17 @@
 # pong.py
 
-import json
+import time
 
 import pygame
-from game import Game
-from menu import Menu
-from pygame.locals import FULLSCREEN, QUIT
+from audio import Audio
+from keyboard import EVENTS, Keyboard
+from profiler import Profiler
+from pygame.locals import FULLSCREEN, SCALED
 from scene import Scene
+from scene_registry import SceneRegistry
+from settings import Settings
+from text_cache import TextCache
+from view import View
 
 
 class Pong:
@@ -14,47 +19,154 @@ class Pong:
 
     def __init__(self) -> None:
         """Inicializa uma instância do jogo"""
-        with open("config/settings.json", "r") as file:
-            self.settings = json.load(file)
+        self.settings = Settings.load("config/settings.json")
 
         pygame.mixer.pre_init(
-            self.settings["mixer.frequency"],
-            self.settings["mixer.size"],
-            self.settings["mixer.channels"],
-            self.settings["mixer.buffer"],
+            self.settings.mixer_frequency,
+            self.settings.mixer_size,
+            self.settings.mixer_channels,
+            self.settings.mixer_buffer,
         )
         pygame.init()
-        flags = FULLSCREEN
-        self.screen = pygame.display.set_mode((self.settings["screen.width"], self.settings["screen.height"]), flags)
+        self.screen = self.open_display()
         pygame.mouse.set_visible(False)
-        pygame.event.set_allowed([QUIT])
+
+        # Só os eventos tratados pelas cenas entram na fila; movimentos do mouse e da janela não a enchem
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EVENTS)
+        self.keyboard = Keyboard(self.settings)
+        self.text_cache = TextCache(self.settings)
+        self.text_cache.preload(
+            [str(points) for points in range(self.settings.game_points_max + 1)],
+            self.settings.font_family,
+            View(self.settings).font_size(self.settings.game_score_font_size),
+            self.settings.font_rgb,
+        )
+        self.audio = Audio(self.settings)
+        self.audio.start()
+        self.scenes = SceneRegistry(self.screen, self.settings, self.text_cache, self.audio, self.keyboard)
+        self.scene = None
         self.change_scene(Scene.MENU)
-        self.clock = pygame.time.Clock()
+        self.last_tick = time.perf_counter()
+        self.profiler = None
+
+        if self.settings.profiler_enabled:
+            self.profiler = Profiler(self.settings, self.text_cache)
+
+    def open_display(self) -> pygame.surface.Surface:
+        """Abre a tela e define o limite de quadros por segundo conforme o ritmo configurado"""
+        size = self.settings.render_size
+        # Em resolução interna menor, a tela tem esse tamanho e o SDL a amplia uma vez por quadro
+        flags = FULLSCREEN if size == (self.settings.screen_width, self.settings.screen_height) else FULLSCREEN | SCALED
+        self.frame_rate = self.settings.game_fps if self.settings.render_pacing == "fixed" else 0
+
+        if self.settings.render_pacing == "vsync":
+            try:
+                return pygame.display.set_mode(size, FULLSCREEN | SCALED, vsync=1)
+            except pygame.error:
+                # Sem sincronismo vertical, volta ao limite fixo para não girar em vão
+                self.frame_rate = self.settings.game_fps
+
+        return pygame.display.set_mode(size, flags)
+
+    def tick(self) -> float:
+        """Aguarda o próximo quadro e retorna o tempo decorrido desde o anterior"""
+        if self.frame_rate:
+            # Espera em fatias curtas lendo o teclado, para cada tecla ser marcada com a hora em que chegou
+            deadline = self.last_tick + 1.0 / self.frame_rate
+
+            while (remaining := deadline - time.perf_counter()) > 0:
+                self.keyboard.poll()
+                time.sleep(min(remaining, self.settings.input_poll_interval))
+
+        # O relógio do pygame mede em milissegundos inteiros, grosso demais para a interpolação
+        now = time.perf_counter()
+        dt = now - self.last_tick
+        self.last_tick = now
+        return dt
 
     def change_scene(self, scene_name: Scene) -> None:
         """Troca a cena ativa"""
+        if self.scene is not None:
+            self.scene.suspend()
+
         self.scene_name = scene_name
+        self.scene = self.scenes.get(self.scene_name)
+        self.scene.reset()
 
-        if self.scene_name == Scene.MENU:
-            self.scene = Menu(self.screen, self.settings)
-        elif self.scene_name == Scene.GAME:
-            self.scene = Game(self.screen, self.settings)
+        if self.settings.scene_warmup:
+            for name in Scene:
+                if name != Scene.ONLINE or self.settings.net_remote_host:
+                    self.scenes.warm(name)
 
     def run(self) -> None:
         """Executa uma instância do jogo"""
         while self.scene.running:
-            dt = self.clock.tick(self.settings["game.fps"]) / 1000.0
-            self.scene.process_events()
-            self.scene.process_logic(dt)
-            self.scene.process_frames()
+            if self.profiler is not None:
+                self.run_profiled_frame()
+            else:
+                dt = self.tick()
+                self.scene.process_events()
+                self.scene.process_logic(dt)
+                self.present(self.scene.process_frames())
 
             if self.scene.next_scene_name != self.scene_name:
                 scene_name = self.scene.next_scene_name
                 self.scene.next_scene_name = self.scene.scene_name
                 self.change_scene(scene_name)
 
+        self.scene.suspend()
+
+        if self.profiler is not None:
+            self.profiler.dump(self.settings.profiler_output)
+
         pygame.quit()
 
+    def run_profiled_frame(self) -> None:
+        """Executa um quadro medindo o tempo de cada fase"""
+        self.profiler.begin()
+        dt = self.tick()
+        self.profiler.mark("wait")
+        self.scene.process_events()
+        self.profiler.mark("events")
+        self.scene.process_logic(dt)
+        self.profiler.mark("logic")
+        rects = self.scene.process_frames()
+
+        if self.settings.profiler_overlay:
+            rect = self.profiler.draw(self.screen)
+
+            if rects is not None:
+                rects.append(rect)
+
+        self.profiler.mark("frames")
+        self.present(rects)
+        self.profiler.mark("flip")
+        self.profiler.report("text_cache", self.text_cache.stats())
+        self.profiler.report("input", self.keyboard.stats())
+
+        if self.scene_name in (Scene.GAME, Scene.ONLINE):
+            simulation = self.scene.simulation
+
+            if self.scene_name == Scene.ONLINE:
+                self.profiler.report("rollback", self.scene.rollback.stats())
+
+            if self.scene.multiball is not None:
+                self.profiler.report("multiball", self.scene.multiball.stats())
+
+            self.profiler.end(simulation.substeps, simulation.accumulator, simulation.clamped)
+        else:
+            self.profiler.end(0, 0.0, 0.0)
+
+    def present(self, rects: list[pygame.Rect] | None) -> None:
+        """Apresenta o quadro, atualizando apenas as áreas alteradas quando informadas"""
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+        self.keyboard.presented()
+
 
 if __name__ == "__main__":
     Pong().run()
@@ -0,0 +1,152 @@
+# profiler.py
+
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+from settings import Settings
+from text_cache import TextCache
+from view import View
+
+
+class Profiler:
+    """Define um perfilador do tempo de cada fase dos quadros"""
+
+    def __init__(self, settings: Settings, text_cache: TextCache) -> None:
+        """Inicializa o perfilador com um buffer circular de tamanho fixo"""
+        self.settings = settings
+        self.text_cache = text_cache
+        self.phases = ["wait", "events", "logic", "frames", "flip"]
+        self.columns = [*self.phases, "total", "substeps", "backlog", "clamped"]
+        self.capacity = self.settings.profiler_capacity
+        self.font_size = View(self.settings).font_size(self.settings.profiler_font_size)
+        self.samples = np.zeros((self.capacity, len(self.columns)))
+        self.current = np.zeros(len(self.columns))
+        self.index = 0
+        self.count = 0
+        self.start = 0.0
+        self.last = 0.0
+        self.reports: dict[str, dict] = {}
+
+        # Sobreposição
+        self.overlay = None
+        self.overlay_rect = pygame.Rect(0, 0, 0, 0)
+        self.overlay_frames = 0
+
+    def begin(self) -> None:
+        """Inicia a medição de um quadro"""
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.current[:] = 0.0
+
+    def mark(self, phase: str) -> None:
+        """Registra o tempo da fase que acabou de terminar"""
+        now = time.perf_counter()
+        self.current[self.columns.index(phase)] += now - self.last
+        self.last = now
+
+    def end(self, substeps: int, backlog: float, clamped: float) -> None:
+        """Conclui a medição do quadro e a guarda no buffer circular"""
+        self.current[-4] = self.last - self.start
+        self.current[-3] = substeps
+        self.current[-2] = backlog
+        self.current[-1] = clamped
+        self.samples[self.index] = self.current
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def report(self, name: str, stats: dict) -> None:
+        """Guarda as estatísticas mais recentes de um subsistema para a sobreposição e o relatório"""
+        self.reports[name] = stats
+
+    def get_samples(self) -> np.ndarray:
+        """Retorna as amostras guardadas, da mais antiga para a mais recente"""
+        if self.count < self.capacity:
+            return self.samples[: self.count]
+
+        return np.roll(self.samples, -self.index, axis=0)
+
+    def percentiles(self) -> dict[str, tuple[float, float]]:
+        """Retorna os percentis 50 e 99 de cada coluna"""
+        samples = self.get_samples()
+
+        if len(samples) == 0:
+            return {column: (0.0, 0.0) for column in self.columns}
+
+        p50, p99 = np.percentile(samples, [50, 99], axis=0)
+        return {column: (p50[i], p99[i]) for i, column in enumerate(self.columns)}
+
+    def draw(self, screen: pygame.surface.Surface) -> pygame.Rect:
+        """Desenha a sobreposição com os percentis e retorna a área ocupada"""
+        if self.overlay is None or self.overlay_frames >= self.settings.profiler_overlay_interval:
+            self.overlay = self.render_overlay()
+            self.overlay_frames = 0
+
+        self.overlay_frames += 1
+        self.overlay_rect = self.overlay.get_rect()
+        screen.blit(self.overlay, self.overlay_rect)
+
+        return self.overlay_rect
+
+    def render_overlay(self) -> pygame.surface.Surface:
+        """Renderiza a sobreposição a partir das amostras atuais"""
+        font = self.text_cache.get_font(self.settings.font_family, self.font_size)
+        color = self.settings.font_rgb
+        lines = []
+
+        for column, (p50, p99) in self.percentiles().items():
+            if column == "substeps":
+                lines.append(f"{column:<8} p50 {p50:7.2f}  p99 {p99:7.2f}")
+            else:
+                lines.append(f"{column:<8} p50 {p50 * 1000:5.2f}ms  p99 {p99 * 1000:5.2f}ms")
+
+        for name, stats in self.reports.items():
+            lines.append(name)
+            lines.extend(f"  {key:<20} {value:g}" for key, value in stats.items())
+
+        with self.text_cache.lock:
+            images = [font.render(line, True, color) for line in lines]
+        width = max(image.get_width() for image in images)
+        height = sum(image.get_height() for image in images)
+        # Tamanho mínimo fixo para que a caixa apague o texto anterior por inteiro
+        size = (max(width, self.overlay_rect.width), max(height, self.overlay_rect.height))
+        overlay = pygame.surface.Surface(size)
+        overlay.fill(self.settings.screen_rgb)
+        y = 0
+
+        for image in images:
+            overlay.blit(image, (0, y))
+            y += image.get_height()
+
+        return overlay
+
+    def dump(self, prefix: str) -> None:
+        """Grava as amostras em CSV e os histogramas de cada coluna em JSON"""
+        samples = self.get_samples()
+
+        with open(f"{prefix}.csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns)
+            writer.writerows(samples.tolist())
+
+        report = {"frames": len(samples), "columns": {}, "reports": self.reports}
+
+        for i, column in enumerate(self.columns):
+            values = samples[:, i]
+
+            if len(values) == 0:
+                continue
+
+            counts, edges = np.histogram(values, bins=self.settings.profiler_histogram_bins)
+            p50, p99 = np.percentile(values, [50, 99])
+            report["columns"][column] = {
+                "p50": p50,
+                "p99": p99,
+                "max": values.max(),
+                "histogram": {"counts": counts.tolist(), "edges": edges.tolist()},
+            }
+
+        with open(f"{prefix}.json", "w") as file:
+            json.dump(report, file, indent=4)
@@ -0,0 +1,137 @@
+# rasterizer.py
+
+import numpy as np
+import pygame
+from audio import Audio
+from batch_simulation import BatchSimulation
+from game import Game
+from settings import Settings
+from text import Text
+from text_cache import TextCache
+
+
+def to_gray(pixels: np.ndarray) -> np.ndarray:
+    """Converte pixels RGB, no formato (..., 3), para tons de cinza pela luminância"""
+    pixels = pixels.astype(np.uint32)
+    return ((pixels[..., 0] * 299 + pixels[..., 1] * 587 + pixels[..., 2] * 114 + 500) // 1000).astype(np.uint8)
+
+
+def to_array(surface: pygame.surface.Surface) -> np.ndarray:
+    """Copia uma superfície para um array RGB no formato (altura, largura, 3)"""
+    return pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+
+
+class Rasterizer:
+    """Define o desenho vetorizado de várias partidas em tons de cinza, direto em um tensor NumPy"""
+
+    def __init__(self, settings: Settings, count: int, downsample: int = 1, stack: int = 1) -> None:
+        """Inicializa os tensores e as peças fixas a partir de uma sessão do jogo usada como modelo"""
+        if downsample <= 0 or stack <= 0:
+            raise ValueError(f"Downsample and stack must be positive, got {downsample!r} and {stack!r}")
+
+        self.settings = settings
+        self.count = count
+        self.downsample = downsample
+        self.width, self.height = settings.render_size
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        # A sessão modelo fornece as mesmas áreas, textos e campo que a tela desenharia
+        screen = pygame.surface.Surface(settings.render_size)
+        game = Game(screen, settings, TextCache(settings), Audio(settings))
+        playfield = game.playfield.get()
+        self.background = to_gray(to_array(playfield))
+        self.view = game.view
+        self.ball_size = game.ball.rect.size
+        self.ball_gray = to_gray(np.array(settings.ball_rgb[:3]))
+        self.paddle_size = game.left_paddle.rect.size
+        self.paddles_left = np.array([game.left_paddle.rect.x, game.right_paddle.rect.x])
+        self.paddle_gray = to_gray(np.array(settings.paddle_rgb[:3]))
+
+        # Placares pré-compostos sobre o campo, um recorte por lado e por valor
+        self.scores = []
+        bounds = screen.get_rect()
+
+        for text in [game.left_score_text, game.right_score_text]:
+            patches = []
+
+            for value in range(settings.game_points_max + 1):
+                image = game.render_text(str(value), game.score_font_size)
+                area = Text(image, text.x, text.y).rect
+                surface = playfield.copy()
+                surface.blit(image, area)
+                area = area.clip(bounds)
+                patches.append((area, to_gray(to_array(surface.subsurface(area)))))
+
+            self.scores.append(patches)
+
+        self.indices = np.arange(count)
+        self.rows = np.arange(self.height)
+        self.columns = np.arange(self.width)
+
+        # Quadro atual na resolução interna e pilha dos últimos quadros reduzidos
+        self.canvas = np.zeros((count, self.height, self.width), dtype=np.uint8)
+        self.frames = np.zeros((count, stack, self.height // downsample, self.width // downsample), dtype=np.uint8)
+
+    def draw(self, ball_x: np.ndarray, ball_y: np.ndarray, paddles_y: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        """Desenha as partidas no quadro atual, na ordem das camadas da tela, e o retorna no formato (N, H, W)"""
+        self.canvas[:] = self.background
+
+        # Placares, na camada de baixo
+        for side, patches in enumerate(self.scores):
+            for value, (area, patch) in enumerate(patches):
+                mask = scores[:, side] == value
+
+                if mask.any():
+                    self.canvas[mask, area.top : area.bottom, area.left : area.right] = patch
+
+        # Raquetes e, por cima delas, a bola, nas posições convertidas como fazem os sprites
+        for side in range(2):
+            top = np.rint(paddles_y[:, side] * self.view.scale_y).astype(np.int64)
+            left = np.full(self.count, self.paddles_left[side])
+            self.fill(left, top, self.paddle_size, self.paddle_gray)
+
+        left = np.rint(ball_x * self.view.scale_x).astype(np.int64)
+        top = np.rint(ball_y * self.view.scale_y).astype(np.int64)
+        self.fill(left, top, self.ball_size, self.ball_gray)
+        return self.canvas
+
+    def fill(self, left: np.ndarray, top: np.ndarray, size: tuple[int, int], gray: int) -> None:
+        """Pinta em cada partida um retângulo do tamanho informado na posição dela, recortado pela tela"""
+        xs = left[:, None] + self.columns[: size[0]]
+        ys = top[:, None] + self.rows[: size[1]]
+        inside = ((ys >= 0) & (ys < self.height))[:, :, None] & ((xs >= 0) & (xs < self.width))[:, None, :]
+        shape = inside.shape
+        matches = np.broadcast_to(self.indices[:, None, None], shape)[inside]
+        rows = np.broadcast_to(ys[:, :, None], shape)[inside]
+        columns = np.broadcast_to(xs[:, None, :], shape)[inside]
+        self.canvas[matches, rows, columns] = gray
+
+    def push(self, fresh: np.ndarray | None = None) -> np.ndarray:
+        """Reduz o quadro atual, o empilha como o mais recente e retorna a pilha no formato (N, S, H, W)"""
+        factor = self.downsample
+        height, width = self.frames.shape[2:]
+
+        if factor == 1:
+            frame = self.canvas
+        else:
+            # Média arredondada de cada bloco de factor x factor pixels
+            area = factor * factor
+            blocks = self.canvas[:, : height * factor, : width * factor]
+            blocks = blocks.reshape(self.count, height, factor, width, factor)
+            frame = ((blocks.sum(axis=(2, 4), dtype=np.uint32) + area // 2) // area).astype(np.uint8)
+
+        self.frames[:, :-1] = self.frames[:, 1:]
+        self.frames[:, -1] = frame
+
+        # Partidas recém-começadas não herdam quadros da anterior
+        if fresh is not None and fresh.any():
+            self.frames[fresh] = self.frames[fresh, -1:]
+
+        return self.frames
+
+    def observe(self, batch: BatchSimulation) -> np.ndarray:
+        """Desenha o estado atual das partidas e retorna a pilha de quadros"""
+        self.draw(batch.ball_x, batch.ball_y, batch.paddles_y, batch.scores)
+        return self.push(batch.finished | (batch.steps == 0))
@@ -0,0 +1,71 @@
+# recorder.py
+
+import json
+import struct
+import zlib
+
+from side import Side
+from simulation import Simulation
+from state import BALL_X, BALL_Y
+
+MAGIC = b"PONGREC2"
+HEADER = struct.Struct("<8sQII")
+SIZE = struct.Struct("<I")
+DIGEST = struct.Struct("<QIIii")
+RIGHT = 0b100
+RESTART = 0b10000
+STEP = 0b100000
+
+
+class Recorder:
+    """Define um gravador da semente e da sequência de entradas e passos de uma partida"""
+
+    def __init__(self, simulation: Simulation) -> None:
+        """Inicializa o gravador e o associa à simulação"""
+        if simulation.settings.physics_collision_mode != "discrete":
+            raise ValueError("Only the discrete collision mode has fixed steps to record")
+
+        self.simulation = simulation
+        self.seed = simulation.seed
+        self.steps = bytearray()
+        self.simulation.recorder = self
+
+    def sample(self, side: Side, up: bool, down: bool) -> None:
+        """Registra uma leitura da intenção de um jogador"""
+        self.steps.append((RIGHT if side == Side.RIGHT else 0) | bool(up) | (bool(down) << 1))
+
+    def mark_restart(self) -> None:
+        """Registra o reinício da partida"""
+        self.steps.append(RESTART)
+
+    def capture(self) -> None:
+        """Registra o início do próximo passo"""
+        self.steps.append(STEP)
+
+    def detach(self) -> None:
+        """Desassocia o gravador da simulação"""
+        if self.simulation.recorder is self:
+            self.simulation.recorder = None
+
+    def save(self, path: str) -> None:
+        """Grava a partida em um arquivo binário compacto"""
+        settings = json.dumps(self.simulation.settings.to_dict(), sort_keys=True).encode()
+        bounds = self.simulation.bounds
+
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, self.seed, bounds.width, bounds.height))
+            file.write(SIZE.pack(len(settings)))
+            file.write(settings)
+            file.write(digest(self.simulation))
+            file.write(zlib.compress(bytes(self.steps)))
+
+
+def digest(simulation: Simulation) -> bytes:
+    """Resume o estado da simulação para comparar gravação e reprodução"""
+    return DIGEST.pack(
+        simulation.steps,
+        simulation.left_score,
+        simulation.right_score,
+        int(simulation.state.values[BALL_X]),
+        int(simulation.state.values[BALL_Y]),
+    )
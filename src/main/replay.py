@@ -0,0 +1,98 @@
+# replay.py
+
+import argparse
+import json
+import time
+import zlib
+
+import pygame
+from recorder import DIGEST, HEADER, MAGIC, RESTART, RIGHT, SIZE, STEP, digest
+from settings import Settings
+from side import Side
+from simulation import Simulation
+
+
+class Replay:
+    """Define a reprodução sem tela de uma partida gravada"""
+
+    def __init__(self, path: str) -> None:
+        """Carrega uma partida gravada"""
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, self.seed, width, height = HEADER.unpack_from(data)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pong recording")
+
+        offset = HEADER.size
+        (size,) = SIZE.unpack_from(data, offset)
+        offset += SIZE.size
+        self.settings = Settings.from_dict(json.loads(data[offset : offset + size]))
+        offset += size
+        self.digest = data[offset : offset + DIGEST.size]
+        offset += DIGEST.size
+        self.steps = zlib.decompress(data[offset:])
+        self.bounds = pygame.Rect(0, 0, width, height)
+        self.marks = [index for index, value in enumerate(self.steps) if value == STEP]
+        self.count = len(self.marks)
+        self.simulation = Simulation(self.bounds, self.settings, self.seed)
+
+    def seek(self, step: int) -> Simulation:
+        """Avança a reprodução até o passo indicado, recomeçando se ele já passou"""
+        step = min(step, self.count)
+
+        if step < self.simulation.steps:
+            self.simulation.reset(self.seed)
+
+        simulation = self.simulation
+        start = self.marks[simulation.steps - 1] + 1 if simulation.steps > 0 else 0
+        end = self.marks[step - 1] + 1 if step > 0 else 0
+
+        for value in self.steps[start:end]:
+            if value == STEP:
+                simulation.step()
+            elif value == RESTART:
+                simulation.restart()
+            else:
+                side = Side.RIGHT if value & RIGHT else Side.LEFT
+                simulation.set_direction(side, value & 0b1, value & 0b10)
+
+        return simulation
+
+    def play(self) -> Simulation:
+        """Reproduz a partida inteira"""
+        return self.seek(self.count)
+
+    def verify(self) -> bool:
+        """Indica se a reprodução terminou no mesmo estado da gravação"""
+        return digest(self.play()) == self.digest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproduz partidas gravadas sem abrir a tela")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--seek", type=int, default=None)
+    arguments = parser.parse_args()
+    failures = 0
+
+    for path in arguments.paths:
+        start = time.perf_counter()
+        replay = Replay(path)
+
+        if arguments.seek is None:
+            ok = replay.verify()
+            failures += not ok
+            status = "ok" if ok else "MISMATCH"
+        else:
+            replay.seek(arguments.seek)
+            status = "seek"
+
+        simulation = replay.simulation
+        elapsed = time.perf_counter() - start
+        print(
+            f"{path}: {status} step={simulation.steps}/{replay.count} "
+            f"score={simulation.left_score}x{simulation.right_score} time={elapsed:.3f}s"
+        )
+
+    raise SystemExit(1 if failures else 0)
@@ -0,0 +1,152 @@
+# rollback.py
+
+import time
+
+from side import Side
+from simulation import Simulation
+
+UP = 0b1
+DOWN = 0b10
+RESTART = 0b100
+
+
+class Rollback:
+    """Define uma sessão de rollback, que prevê a entrada remota e ressimula os quadros quando ela chega diferente"""
+
+    def __init__(self, simulation: Simulation, side: Side) -> None:
+        """Inicializa a sessão para o jogador do lado informado"""
+        if simulation.settings.physics_collision_mode != "discrete":
+            raise ValueError("Only the discrete collision mode has fixed steps to roll back")
+
+        self.simulation = simulation
+        self.settings = simulation.settings
+        self.side = side
+        self.delay = self.settings.net_input_delay
+        self.window = self.settings.net_rollback_window
+        self.steps_per_frame = max(1, round(1.0 / (self.settings.game_fps * self.simulation.time_step)))
+        self.snapshots = [self.simulation.snapshot() for _ in range(self.window + 1)]
+        self.start(self.simulation.seed)
+
+    def start(self, seed: int) -> None:
+        """Começa uma nova partida com a semente combinada entre os jogadores"""
+        self.simulation.reset(seed)
+        self.frame = 0
+        self.local = bytearray(self.delay)
+        self.remote = bytearray()
+        self.used = bytearray()
+        self.remote_ack = 0
+        self.rollback_frame = None
+
+        # Estatísticas
+        self.steps = 0
+        self.rollbacks = 0
+        self.rollback_frames = 0
+        self.rollback_frames_max = 0
+        self.resimulation_time = 0.0
+        self.resimulation_time_max = 0.0
+        self.mispredictions = 0
+        self.stalls = 0
+
+    def add_remote_inputs(self, ack: int, first: int, inputs: bytes) -> None:
+        """Registra as entradas remotas recebidas e marca o rollback se alguma previsão errou"""
+        self.remote_ack = max(self.remote_ack, ack)
+
+        for frame in range(max(len(self.remote), first), first + len(inputs)):
+            if frame != len(self.remote):
+                break
+
+            value = inputs[frame - first]
+
+            if frame < self.frame and value != self.used[frame]:
+                self.mispredictions += 1
+
+                if self.rollback_frame is None or frame < self.rollback_frame:
+                    self.rollback_frame = frame
+
+            self.remote.append(value)
+
+    def pending_inputs(self) -> tuple[int, bytes]:
+        """Retorna o primeiro quadro e as entradas locais ainda não confirmadas pelo outro jogador"""
+        return self.remote_ack, bytes(self.local[self.remote_ack :])
+
+    def advance(self, bits: int) -> bool:
+        """Avança um quadro com a entrada local, ou retorna False se o outro jogador está atrasado demais"""
+        if self.frame - len(self.remote) >= self.window:
+            self.stalls += 1
+            return False
+
+        if self.rollback_frame is not None:
+            self.resimulate()
+
+        self.local.append(bits)
+        self.simulation.events.clear()
+        self.simulate(self.frame)
+        self.frame += 1
+        return True
+
+    def resimulate(self) -> None:
+        """Restaura o quadro mais antigo com previsão errada e ressimula até o quadro atual"""
+        start = time.perf_counter()
+        target = self.frame
+        frames = target - self.rollback_frame
+        self.simulation.restore(self.snapshots[self.rollback_frame % len(self.snapshots)])
+
+        for frame in range(self.rollback_frame, target):
+            self.simulate(frame)
+
+        self.rollback_frame = None
+        elapsed = time.perf_counter() - start
+        self.rollbacks += 1
+        self.rollback_frames += frames
+        self.rollback_frames_max = max(self.rollback_frames_max, frames)
+        self.resimulation_time += elapsed
+        self.resimulation_time_max = max(self.resimulation_time_max, elapsed)
+
+    def simulate(self, frame: int) -> None:
+        """Simula um quadro com a entrada remota confirmada ou prevista"""
+        self.snapshots[frame % len(self.snapshots)][:] = self.simulation.state.values
+
+        if frame < len(self.remote):
+            remote = self.remote[frame]
+        elif self.remote:
+            remote = self.remote[-1] & ~RESTART
+        else:
+            remote = 0
+
+        if frame < len(self.used):
+            self.used[frame] = remote
+        else:
+            self.used.append(remote)
+
+        local = self.local[frame]
+
+        if (local | remote) & RESTART:
+            self.simulation.restart()
+
+        if self.side == Side.LEFT:
+            left, right = local, remote
+        else:
+            left, right = remote, local
+
+        # A direção é aplicada a cada passo, para a aceleração das raquetes não depender do quadro
+        for _ in range(self.steps_per_frame):
+            self.simulation.set_direction(Side.LEFT, left & UP, left & DOWN)
+            self.simulation.set_direction(Side.RIGHT, right & UP, right & DOWN)
+            self.simulation.step()
+
+        self.steps += self.steps_per_frame
+
+    def stats(self) -> dict:
+        """Retorna as estatísticas de rollback e ressimulação"""
+        return {
+            "frame": self.frame,
+            "confirmed": len(self.remote),
+            "steps": self.steps,
+            "rollbacks": self.rollbacks,
+            "rollback_frames": self.rollback_frames,
+            "rollback_frames_max": self.rollback_frames_max,
+            "resimulation_ms": self.resimulation_time * 1000,
+            "resimulation_ms_max": self.resimulation_time_max * 1000,
+            "mispredictions": self.mispredictions,
+            "stalls": self.stalls,
+        }
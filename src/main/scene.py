@@ -8,3 +8,4 @@ class Scene(Enum):
 
     MENU = 0
     GAME = 1
+    ONLINE = 2
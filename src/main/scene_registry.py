@@ -0,0 +1,70 @@
+# scene_registry.py
+
+import threading
+
+import pygame
+from audio import Audio
+from game import Game
+from keyboard import Keyboard
+from menu import Menu
+from online_game import OnlineGame
+from scene import Scene
+from settings import Settings
+from text_cache import TextCache
+
+
+class SceneRegistry:
+    """Define um registro de cenas construídas uma única vez"""
+
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        settings: Settings,
+        text_cache: TextCache,
+        audio: Audio,
+        keyboard: Keyboard,
+    ) -> None:
+        """Inicializa o registro de cenas"""
+        self.settings = settings
+        self.screen = screen
+        self.text_cache = text_cache
+        self.audio = audio
+        self.keyboard = keyboard
+        self.scenes: dict[Scene, Menu | Game] = {}
+        self.threads: dict[Scene, threading.Thread] = {}
+        self.lock = threading.Lock()
+
+    def get(self, scene_name: Scene) -> Menu | Game:
+        """Retorna a cena, construindo-a se ainda não existir"""
+        thread = self.threads.pop(scene_name, None)
+
+        if thread is not None:
+            thread.join()
+
+        if scene_name not in self.scenes:
+            self.scenes[scene_name] = self.build(scene_name)
+
+        return self.scenes[scene_name]
+
+    def warm(self, scene_name: Scene) -> None:
+        """Constrói a cena em segundo plano, se ainda não existir"""
+        if scene_name in self.scenes or scene_name in self.threads:
+            return
+
+        thread = threading.Thread(target=self.store, args=(scene_name,), daemon=True)
+        self.threads[scene_name] = thread
+        thread.start()
+
+    def store(self, scene_name: Scene) -> None:
+        """Constrói e guarda a cena, uma de cada vez"""
+        with self.lock:
+            self.scenes[scene_name] = self.build(scene_name)
+
+    def build(self, scene_name: Scene) -> Menu | Game:
+        """Constrói uma nova instância da cena"""
+        if scene_name == Scene.MENU:
+            return Menu(self.screen, self.settings, self.text_cache, self.audio, self.keyboard)
+        elif scene_name == Scene.GAME:
+            return Game(self.screen, self.settings, self.text_cache, self.audio, self.keyboard)
+        elif scene_name == Scene.ONLINE:
+            return OnlineGame(self.screen, self.settings, self.text_cache, self.audio, self.keyboard)
@@ -0,0 +1,348 @@
+# settings.py
+
+import dataclasses
+import json
+import os
+
+import pygame
+
+GRIDS = {"screen.grid.width": "screen_grid_width", "screen.grid.height": "screen_grid_height"}
+GRID_SIZE = 12
+COLORS = ["font.color", "screen.color", "ball.color", "paddle.color", "wall.color", "goal.color", "dash.color"]
+FILES = [
+    "font.family",
+    "start.sound",
+    "collision.sound",
+    "score.sound",
+    "winner.sound",
+    "restart.sound",
+    "background.music",
+]
+OPTIONAL = ["background.music"]
+POSITIVE = [
+    "game.fps",
+    "game.points.max",
+    "screen.width",
+    "screen.height",
+    "text.cache.capacity",
+    "physics.steps.max",
+    "physics.swept.distance.max",
+    "input.poll.interval",
+    "net.rollback.window",
+    "profiler.capacity",
+    "profiler.overlay.interval",
+    "profiler.histogram.bins",
+    "mixer.frequency",
+    "mixer.buffer",
+    "mixer.buffer.min",
+    "ball.size",
+    "ball.speed",
+    "ball.count",
+    "paddle.width",
+    "paddle.height",
+]
+CHOICES = {
+    "render.mode": ["full", "dirty"],
+    "physics.collision.mode": ["discrete", "swept"],
+    "render.pacing": ["fixed", "vsync", "unlimited"],
+    "net.side": ["left", "right"],
+    "ai.side": ["none", "left", "right"],
+    "ai.difficulty": ["easy", "normal", "hard"],
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Settings:
+    """Define as configurações do jogo, validadas e imutáveis, com os valores derivados já calculados"""
+
+    font_family: str
+    font_color: str
+    game_score_font_size: int
+    game_winner_font_size: int
+    game_winner_text: str
+    game_option_font_size: int
+    menu_title_font_size: int
+    menu_option_font_size: int
+    menu_title_text: str
+    menu_start_text: str
+    menu_exit_text: str
+    menu_online_text: str
+    submenu_restart_text: str
+    submenu_exit_text: str
+    text_cache_capacity: int
+
+    game_fps: float
+    game_points_max: int
+    scene_warmup: bool
+    record_directory: str
+
+    ai_side: str
+    ai_difficulty: str
+
+    net_side: str
+    net_local_port: int
+    net_remote_host: str
+    net_remote_port: int
+    net_input_delay: int
+    net_rollback_window: int
+    net_latency: float
+    net_jitter: float
+    net_loss: float
+    net_waiting_text: str
+
+    profiler_enabled: bool
+    profiler_capacity: int
+    profiler_overlay: bool
+    profiler_overlay_interval: int
+    profiler_font_size: int
+    profiler_histogram_bins: int
+    profiler_output: str
+
+    physics_collision_mode: str
+    physics_swept_distance_max: float
+    physics_swept_impacts_max: int
+    physics_steps_max: int
+
+    input_poll_interval: float
+
+    mixer_frequency: int
+    mixer_size: int
+    mixer_channels: int
+    mixer_buffer: int
+    mixer_buffer_min: int
+    mixer_buffer_auto: bool
+    mixer_latency_target: float
+
+    screen_width: int
+    screen_height: int
+    screen_color: str
+    render_width: int
+    render_height: int
+    render_mode: str
+    render_pacing: str
+    render_interpolation: bool
+
+    screen_grid_width: tuple[float, ...]
+    screen_grid_height: tuple[float, ...]
+
+    sound_volume: float
+    music_volume: float
+
+    start_sound: str
+    collision_sound: str
+    collision_sound_cooldown: float
+    score_sound: str
+    winner_sound: str
+    restart_sound: str
+    background_music: str
+
+    ball_speed: float
+    ball_size: int
+    ball_color: str
+    ball_angle_max: float
+    ball_ready_time_appear: float
+    ball_ready_time_settledown: float
+    ball_ready_time_play: float
+    ball_acceleration: float
+    ball_acceleration_increment: float
+    ball_speed_max: float
+    ball_count: int
+    ball_collisions: bool
+
+    dash_size: int
+    dash_color: str
+
+    wall_size: int
+    wall_color: str
+
+    goal_size: int
+    goal_color: str
+
+    paddle_speed: float
+    paddle_width: int
+    paddle_height: int
+    paddle_color: str
+    paddle_acceleration: float
+    paddle_acceleration_increment: float
+
+    # Valores derivados
+    time_step: float = dataclasses.field(init=False)
+    render_size: tuple[int, int] = dataclasses.field(init=False)
+    render_scale_x: float = dataclasses.field(init=False)
+    render_scale_y: float = dataclasses.field(init=False)
+    grid_x: tuple[int, ...] = dataclasses.field(init=False)
+    grid_y: tuple[int, ...] = dataclasses.field(init=False)
+    font_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    screen_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    ball_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    paddle_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    wall_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    goal_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+    dash_rgb: tuple[int, int, int, int] = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        """Valida as configurações e calcula os valores derivados"""
+        errors = self.validate()
+
+        if errors:
+            raise ValueError("Invalid settings:\n  " + "\n  ".join(errors))
+
+        # A simulação usa as unidades lógicas da tela; a resolução interna zerada acompanha a tela
+        width = self.render_width or self.screen_width
+        height = self.render_height or self.screen_height
+        derived = {
+            "time_step": 1.0 / (self.game_fps * 2.0),
+            "render_size": (width, height),
+            "render_scale_x": width / self.screen_width,
+            "render_scale_y": height / self.screen_height,
+            "grid_x": tuple(round(width * fraction) for fraction in self.screen_grid_width),
+            "grid_y": tuple(round(height * fraction) for fraction in self.screen_grid_height),
+        }
+
+        for key in COLORS:
+            name = key.split(".")[0]
+            derived[f"{name}_rgb"] = tuple(pygame.color.THECOLORS[getattr(self, to_attribute(key))])
+
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    def validate(self) -> list[str]:
+        """Retorna os problemas encontrados nos tipos e valores das configurações"""
+        errors = []
+
+        for field in dataclasses.fields(self):
+            if not field.init:
+                continue
+
+            value = getattr(self, field.name)
+
+            if field.type is float and type(value) is int:
+                object.__setattr__(self, field.name, float(value))
+            elif field.name in GRIDS.values():
+                if len(value) != GRID_SIZE + 1 or not all(type(v) in [int, float] for v in value):
+                    errors.append(f"{to_key(field.name)}: expected {GRID_SIZE + 1} numbers")
+            elif type(value) is not field.type:
+                errors.append(f"{to_key(field.name)}: expected {field.type.__name__}, got {value!r}")
+
+        for key in COLORS:
+            value = getattr(self, to_attribute(key))
+
+            if value not in pygame.color.THECOLORS:
+                errors.append(f"{key}: unknown color {value!r}")
+
+        for key, choices in CHOICES.items():
+            value = getattr(self, to_attribute(key))
+
+            if value not in choices:
+                errors.append(f"{key}: expected one of {choices}, got {value!r}")
+
+        if not errors:
+            for key in POSITIVE:
+                value = getattr(self, to_attribute(key))
+
+                if value <= 0:
+                    errors.append(f"{key}: expected a positive number, got {value!r}")
+
+            if self.render_width < 0 or self.render_height < 0:
+                errors.append("render.width, render.height: expected non-negative numbers")
+
+            if self.net_input_delay < 0:
+                errors.append(f"net.input.delay: expected a non-negative number, got {self.net_input_delay!r}")
+
+            if not 0.0 <= self.net_loss < 1.0:
+                errors.append(f"net.loss: expected a number from 0 to 1, got {self.net_loss!r}")
+
+            if self.net_remote_host and self.physics_collision_mode != "discrete":
+                errors.append("net.remote.host: online play needs physics.collision.mode set to 'discrete'")
+
+            if self.record_directory and self.physics_collision_mode != "discrete":
+                errors.append("record.directory: recording needs physics.collision.mode set to 'discrete'")
+
+            if self.ball_count > 1 and self.physics_collision_mode != "discrete":
+                errors.append("ball.count: several balls need physics.collision.mode set to 'discrete'")
+
+            if self.ball_count > 1 and (self.record_directory or self.net_remote_host):
+                errors.append("ball.count: several balls cannot be recorded or played online")
+
+        return errors
+
+    @classmethod
+    def load(cls, path: str) -> "Settings":
+        """Carrega as configurações de um arquivo, com os recursos relativos à raiz do projeto"""
+        with open(path, "r") as file:
+            values = json.load(file)
+
+        return cls.from_dict(values, os.path.dirname(os.path.dirname(os.path.abspath(path))))
+
+    @classmethod
+    def from_dict(cls, values: dict, root: str | None = None) -> "Settings":
+        """Constrói as configurações a partir das chaves do arquivo, verificando os recursos se houver uma raiz"""
+        attributes = {}
+        grids = {attribute: [None] * (GRID_SIZE + 1) for attribute in GRIDS.values()}
+        errors = []
+
+        for key, value in values.items():
+            prefix, _, index = key.rpartition(".")
+            prefix, _, column = prefix.rpartition(".")
+
+            if prefix in GRIDS and index == str(GRID_SIZE) and column.isdigit() and int(column) <= GRID_SIZE:
+                grids[GRIDS[prefix]][int(column)] = value
+            else:
+                attributes[to_attribute(key)] = value
+
+        for attribute, grid in grids.items():
+            attributes[attribute] = tuple(grid)
+
+        if root is not None:
+            for key in FILES:
+                attribute = to_attribute(key)
+
+                if key in OPTIONAL and attributes.get(attribute) == "":
+                    continue
+
+                if isinstance(attributes.get(attribute), str):
+                    attributes[attribute] = os.path.join(root, attributes[attribute])
+
+                    if not os.path.isfile(attributes[attribute]):
+                        errors.append(f"{key}: file not found {attributes[attribute]!r}")
+
+        names = {field.name for field in dataclasses.fields(cls) if field.init}
+        errors.extend(f"{to_key(name)}: missing" for name in sorted(names - attributes.keys()))
+        errors.extend(f"{to_key(name)}: unknown setting" for name in sorted(attributes.keys() - names))
+
+        if errors:
+            raise ValueError("Invalid settings:\n  " + "\n  ".join(errors))
+
+        return cls(**attributes)
+
+    def to_dict(self) -> dict:
+        """Retorna as configurações com as chaves do arquivo"""
+        values = {}
+
+        for field in dataclasses.fields(self):
+            if not field.init:
+                continue
+
+            value = getattr(self, field.name)
+
+            if field.name in GRIDS.values():
+                for column, fraction in enumerate(value):
+                    values[f"{to_key(field.name)}.{column:02d}.{GRID_SIZE}"] = fraction
+            else:
+                values[to_key(field.name)] = value
+
+        return values
+
+    def replace(self, **changes) -> "Settings":
+        """Retorna uma cópia com os valores alterados e os derivados recalculados"""
+        return dataclasses.replace(self, **changes)
+
+
+def to_attribute(key: str) -> str:
+    """Converte uma chave do arquivo no nome do atributo"""
+    return key.replace(".", "_")
+
+
+def to_key(attribute: str) -> str:
+    """Converte o nome de um atributo na chave do arquivo"""
+    return attribute.replace("_", ".")
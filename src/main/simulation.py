@@ -0,0 +1,605 @@
+# simulation.py
+
+import math
+import random
+from array import array
+from collections.abc import Callable
+
+import pygame
+from ball_state import BallState
+from body import Body
+from event import Event
+from settings import Settings
+from side import Side
+from state import (
+    ACCUMULATOR,
+    BALL_ACCELERATION,
+    BALL_ACCUMULATOR,
+    BALL_STATE,
+    BALL_VX,
+    BALL_VY,
+    BALL_X,
+    BALL_Y,
+    DRAWS,
+    PADDLE_ACCELERATION,
+    PADDLE_ACCUMULATOR,
+    PADDLE_VY,
+    PADDLE_Y,
+    PREVIOUS_BALL_X,
+    PREVIOUS_BALL_Y,
+    PREVIOUS_PADDLE_Y,
+    SCORE,
+    STEPS,
+    WINNER,
+    State,
+)
+
+WAITING = BallState.WAITING.value
+RUNNING = BallState.RUNNING.value
+READY = BallState.READY.value
+LEFT = Side.LEFT.value
+RIGHT = Side.RIGHT.value
+NO_WINNER = -1
+
+
+def overlaps(x: float, y: float, width: int, height: int, rect: pygame.Rect) -> bool:
+    """Indica se a caixa se sobrepõe ao retângulo, como pygame.Rect.colliderect"""
+    return x < rect.right and x + width > rect.left and y < rect.bottom and y + height > rect.top
+
+
+class Simulation:
+    """Define a simulação de uma partida, sem tela, áudio ou fila de eventos"""
+
+    def __init__(self, bounds: pygame.Rect, settings: Settings, seed: int | None = None) -> None:
+        """Inicializa a simulação de uma partida"""
+        self.settings = settings
+        self.bounds = pygame.Rect(bounds)
+        self.random = random.Random()
+        self.recorder = None
+        self.multiball = None
+        self.state = State()
+
+        # Paredes
+        self.top_wall = Body(pygame.Rect(0, 0, self.bounds.width, self.settings.wall_size), Side.TOP)
+        self.top_wall.rect.topleft = self.bounds.topleft
+        self.bottom_wall = Body(pygame.Rect(0, 0, self.bounds.width, self.settings.wall_size), Side.BOTTOM)
+        self.bottom_wall.rect.bottomleft = self.bounds.bottomleft
+
+        # Gols
+        goal_size = (self.settings.goal_size, self.bounds.height + (self.settings.goal_size * 4))
+        self.left_goal = Body(pygame.Rect((0, 0), goal_size), Side.LEFT)
+        self.left_goal.rect.top = self.bounds.top - (self.settings.goal_size * 2)
+        self.left_goal.rect.left = self.bounds.left - (self.settings.goal_size * 2)
+        self.right_goal = Body(pygame.Rect((0, 0), goal_size), Side.RIGHT)
+        self.right_goal.rect.top = self.bounds.top - (self.settings.goal_size * 2)
+        self.right_goal.rect.right = self.bounds.right + (self.settings.goal_size * 2)
+
+        # Raquetes, com a posição vertical no bloco de estado
+        paddle_size = (self.settings.paddle_width, self.settings.paddle_height)
+        self.left_paddle = Body(pygame.Rect((0, 0), paddle_size), Side.LEFT)
+        self.left_paddle.rect.left = self.bounds.left + (self.left_paddle.rect.width * 3)
+        self.left_paddle.rect.centery = self.bounds.centery
+        self.right_paddle = Body(pygame.Rect((0, 0), paddle_size), Side.RIGHT)
+        self.right_paddle.rect.right = self.bounds.right - (self.right_paddle.rect.width * 3)
+        self.right_paddle.rect.centery = self.bounds.centery
+
+        # Bola, com a posição no bloco de estado
+        ball_size = (self.settings.ball_size, self.settings.ball_size)
+        self.ball = Body(pygame.Rect((0, 0), ball_size))
+
+        self.paddles = [self.left_paddle, self.right_paddle]
+        self.walls = [self.top_wall, self.bottom_wall]
+        self.walls_rects = [self.top_wall.rect, self.bottom_wall.rect]
+        self.goals = [self.left_goal, self.right_goal]
+        self.goals_rects = [self.left_goal.rect, self.right_goal.rect]
+
+        # Limites das raquetes entre as paredes
+        self.paddle_top_min = self.bounds.top + self.settings.wall_size
+        self.paddle_top_max = self.bounds.bottom - self.settings.wall_size - self.settings.paddle_height
+
+        self.events: list[Event] = []
+        self.time_step = self.settings.time_step
+        self.steps_max = self.settings.physics_steps_max
+        self.reset(seed)
+
+    @property
+    def left_score(self) -> int:
+        """Retorna os pontos do jogador da esquerda"""
+        return int(self.state.values[SCORE[LEFT]])
+
+    @property
+    def right_score(self) -> int:
+        """Retorna os pontos do jogador da direita"""
+        return int(self.state.values[SCORE[RIGHT]])
+
+    @property
+    def winner(self) -> Side | None:
+        """Retorna o lado vencedor, se a partida terminou"""
+        winner = int(self.state.values[WINNER])
+        return None if winner == NO_WINNER else Side(winner)
+
+    @property
+    def ball_state(self) -> BallState:
+        """Retorna o estado da bola"""
+        return BallState(int(self.state.values[BALL_STATE]))
+
+    @property
+    def steps(self) -> int:
+        """Retorna o número de passos simulados"""
+        return int(self.state.values[STEPS])
+
+    @property
+    def accumulator(self) -> float:
+        """Retorna o tempo acumulado ainda não simulado"""
+        return self.state.values[ACCUMULATOR]
+
+    def reset(self, seed: int | None = None) -> None:
+        """Coloca a partida no estado inicial, com uma nova semente se nenhuma for informada"""
+        self.seed = seed if seed is not None else random.randrange(2**63)
+        values = self.state.values
+
+        for index, paddle in enumerate(self.paddles):
+            values[PADDLE_Y[index]] = paddle.rect.y
+            values[PADDLE_VY[index]] = 0.0
+            values[PADDLE_ACCELERATION[index]] = self.settings.paddle_acceleration
+
+        values[BALL_X] = -self.settings.ball_size
+        values[BALL_Y] = -self.settings.ball_size
+        values[BALL_VX] = 0.0
+        values[BALL_VY] = 0.0
+        values[BALL_ACCELERATION] = self.settings.ball_acceleration
+        values[BALL_STATE] = READY
+        values[BALL_ACCUMULATOR] = 0.0
+
+        # Placar
+        values[SCORE[LEFT]] = 0
+        values[SCORE[RIGHT]] = 0
+        values[WINNER] = NO_WINNER
+
+        values[ACCUMULATOR] = 0.0
+        values[PADDLE_ACCUMULATOR] = 0.0
+        values[STEPS] = 0
+        values[DRAWS] = 0
+        self.settle()
+        self.events.clear()
+        self.substeps = 0
+        self.clamped = 0.0
+        self.clamps = 0
+        self.clamped_time = 0.0
+
+        if self.multiball is not None:
+            self.multiball.reset()
+
+    def snapshot(self) -> array:
+        """Retorna uma cópia do estado da partida"""
+        return self.state.snapshot()
+
+    def restore(self, snapshot: array) -> None:
+        """Volta a partida para um estado copiado antes"""
+        self.state.restore(snapshot)
+
+    def settle(self) -> None:
+        """Iguala as posições anteriores às atuais, para que nada seja interpolado até o próximo passo"""
+        values = self.state.values
+        values[PREVIOUS_BALL_X] = values[BALL_X]
+        values[PREVIOUS_BALL_Y] = values[BALL_Y]
+        values[PREVIOUS_PADDLE_Y[LEFT]] = values[PADDLE_Y[LEFT]]
+        values[PREVIOUS_PADDLE_Y[RIGHT]] = values[PADDLE_Y[RIGHT]]
+
+    def clamp(self, time: float) -> None:
+        """Descarta o tempo acumulado que excede o limite de passos por quadro"""
+        self.state.values[ACCUMULATOR] -= time
+        self.clamped = time
+        self.clamps += 1
+        self.clamped_time += time
+
+    def draw(self) -> random.Random:
+        """Retorna o gerador posicionado no próximo sorteio, que depende só da semente e do bloco de estado"""
+        values = self.state.values
+        self.random.seed((self.seed << 32) + int(values[DRAWS]))
+        values[DRAWS] += 1
+        return self.random
+
+    def advance(self, dt: float, sample: Callable[[float], None] | None = None) -> None:
+        """Avança a simulação e registra os eventos ocorridos, chamando sample antes de cada passo com a duração dele"""
+        self.events.clear()
+        self.substeps = 0
+        self.clamped = 0.0
+        values = self.state.values
+        values[ACCUMULATOR] += dt
+
+        if self.settings.physics_collision_mode == "swept":
+            if values[ACCUMULATOR] > self.steps_max * self.time_step:
+                self.clamp(values[ACCUMULATOR] - self.steps_max * self.time_step)
+
+            # Os passos do modo contínuo não são fixos: as entradas valem para o quadro inteiro
+            if sample is not None:
+                sample(values[ACCUMULATOR])
+
+            self.advance_swept()
+            return
+
+        while values[ACCUMULATOR] >= self.time_step:
+            if self.substeps == self.steps_max:
+                self.clamp(values[ACCUMULATOR] - values[ACCUMULATOR] % self.time_step)
+                break
+
+            if sample is not None:
+                sample(self.time_step)
+
+            self.step()
+            self.substeps += 1
+            values[ACCUMULATOR] -= self.time_step
+
+    def advance_swept(self) -> None:
+        """Avança a simulação em passos adaptados à velocidade da bola"""
+        values = self.state.values
+        distance = 0.0
+
+        if values[BALL_STATE] == RUNNING:
+            distance = math.hypot(values[BALL_VX], values[BALL_VY]) * values[ACCUMULATOR]
+
+        count = max(1, math.ceil(distance / self.settings.physics_swept_distance_max))
+        dt = values[ACCUMULATOR] / count
+
+        # As raquetes andam nos mesmos passos fixos do modo discreto, repartidos entre os passos da bola
+        values[PADDLE_ACCUMULATOR] += values[ACCUMULATOR]
+        paddle_steps = 0
+
+        while values[PADDLE_ACCUMULATOR] >= self.time_step:
+            values[PADDLE_ACCUMULATOR] -= self.time_step
+            paddle_steps += 1
+
+        for index in range(count):
+            self.step_swept(dt, (index + 1) * paddle_steps // count - index * paddle_steps // count)
+
+        values[ACCUMULATOR] = 0.0
+        self.settle()
+
+    def step(self) -> None:
+        """Avança a simulação em um passo fixo"""
+        if self.recorder is not None:
+            self.recorder.capture()
+
+        values = self.state.values
+        values[PREVIOUS_BALL_X] = values[BALL_X]
+        values[PREVIOUS_BALL_Y] = values[BALL_Y]
+        values[PREVIOUS_PADDLE_Y[LEFT]] = values[PADDLE_Y[LEFT]]
+        values[PREVIOUS_PADDLE_Y[RIGHT]] = values[PADDLE_Y[RIGHT]]
+        self.update_paddle(LEFT, self.time_step)
+        self.update_paddle(RIGHT, self.time_step)
+        self.update_ball(self.time_step)
+
+        x = values[BALL_X]
+        y = values[BALL_Y]
+        size = self.ball.rect.width
+
+        # Colisão com as raquetes
+        for index, paddle in enumerate(self.paddles):
+            top = values[PADDLE_Y[index]]
+            bottom = top + paddle.rect.height
+
+            if x < paddle.rect.right and x + size > paddle.rect.left and y < bottom and y + size > top:
+                if (values[BALL_VX] > 0 and paddle.side == Side.RIGHT) or (
+                    values[BALL_VX] < 0 and paddle.side == Side.LEFT
+                ):
+                    self.events.append(Event.COLLISION)
+                    values[BALL_VX] *= -1
+                    self.stroke((y + size // 2) - (top + paddle.rect.height // 2), paddle.side)
+
+                break
+
+        # Colisão com as paredes
+        for wall in self.walls:
+            if overlaps(x, y, size, size, wall.rect):
+                if (values[BALL_VY] > 0 and wall.side == Side.BOTTOM) or (
+                    values[BALL_VY] < 0 and wall.side == Side.TOP
+                ):
+                    self.events.append(Event.COLLISION)
+                    values[BALL_VY] *= -1
+
+                break
+
+        # Colisão com os gols
+        if values[BALL_STATE] == RUNNING:
+            for goal in self.goals:
+                if overlaps(x, y, size, size, goal.rect):
+                    self.handle_goal(goal.side)
+                    break
+
+        if self.multiball is not None and values[WINNER] == NO_WINNER:
+            self.multiball.step()
+
+        values[STEPS] += 1
+
+    def step_swept(self, dt: float, paddle_steps: int) -> None:
+        """Avança a simulação em um passo com detecção contínua de colisões"""
+        values = self.state.values
+
+        for _ in range(paddle_steps):
+            self.update_paddle(LEFT, self.time_step)
+            self.update_paddle(RIGHT, self.time_step)
+
+        if values[BALL_STATE] == READY:
+            self.handle_ready_state(dt)
+            self.substeps += 1
+        elif values[BALL_STATE] == RUNNING:
+            self.sweep_ball(dt)
+        else:
+            self.substeps += 1
+
+        values[STEPS] += 1
+
+    def sweep_ball(self, dt: float) -> None:
+        """Move a bola ao longo do passo, resolvendo cada impacto no instante exato"""
+        values = self.state.values
+        x = values[BALL_X]
+        y = values[BALL_Y]
+        remaining = dt
+        impacts = 0
+
+        while remaining > 0 and values[BALL_STATE] == RUNNING:
+            self.substeps += 1
+            dx = values[BALL_VX] * remaining
+            dy = values[BALL_VY] * remaining
+            target, time = self.find_impact(x, y, dx, dy)
+
+            if target is None or impacts >= self.settings.physics_swept_impacts_max:
+                x += dx
+                y += dy
+                break
+
+            x += dx * time
+            y += dy * time
+            remaining *= 1.0 - time
+            impacts += 1
+            values[BALL_X] = round(x)
+            values[BALL_Y] = round(y)
+            self.resolve_impact(target)
+
+        values[BALL_X] = round(x)
+        values[BALL_Y] = round(y)
+
+    def find_impact(self, x: float, y: float, dx: float, dy: float) -> tuple[Body | None, float]:
+        """Encontra o primeiro corpo atingido pela bola ao longo do deslocamento"""
+        candidates = []
+
+        if dx < 0:
+            candidates.extend([self.left_paddle, self.left_goal])
+        elif dx > 0:
+            candidates.extend([self.right_paddle, self.right_goal])
+
+        if dy < 0:
+            candidates.append(self.top_wall)
+        elif dy > 0:
+            candidates.append(self.bottom_wall)
+
+        target = None
+        first_time = 1.0
+
+        for body in candidates:
+            time = self.time_of_impact(x, y, dx, dy, body)
+
+            if time is not None and (target is None or time < first_time):
+                target = body
+                first_time = time
+
+        return target, first_time
+
+    def time_of_impact(self, x: float, y: float, dx: float, dy: float, body: Body) -> float | None:
+        """Calcula a fração do deslocamento em que a bola encontra o corpo"""
+        top = body.rect.top
+
+        if body in self.paddles:
+            top = self.state.values[PADDLE_Y[self.paddles.index(body)]]
+
+        entry = -math.inf
+        leave = math.inf
+        axes = [
+            (x, dx, body.rect.left - self.ball.rect.width, body.rect.right),
+            (y, dy, top - self.ball.rect.height, top + body.rect.height),
+        ]
+
+        for position, delta, low, high in axes:
+            if delta == 0:
+                if not low < position < high:
+                    return None
+            else:
+                first = (low - position) / delta
+                second = (high - position) / delta
+                entry = max(entry, min(first, second))
+                leave = min(leave, max(first, second))
+
+        if entry >= leave or entry >= 1.0 or leave <= 0.0:
+            return None
+
+        return max(entry, 0.0)
+
+    def resolve_impact(self, target: Body) -> None:
+        """Aplica a resposta ao impacto da bola com um corpo"""
+        values = self.state.values
+
+        if target in self.paddles:
+            self.events.append(Event.COLLISION)
+            values[BALL_VX] *= -1
+            ball_centery = values[BALL_Y] + self.ball.rect.height // 2
+            paddle_centery = values[PADDLE_Y[self.paddles.index(target)]] + target.rect.height // 2
+            self.stroke(ball_centery - paddle_centery, target.side)
+        elif target in self.walls:
+            self.events.append(Event.COLLISION)
+            values[BALL_VY] *= -1
+        elif target in self.goals:
+            self.handle_goal(target.side)
+
+    def set_direction(self, side: Side, up: bool, down: bool) -> None:
+        """Atualiza a direção de uma raquete a partir da intenção do jogador"""
+        if self.recorder is not None:
+            self.recorder.sample(side, up, down)
+
+        if side == Side.LEFT:
+            self.process_interaction(LEFT, up, down)
+        elif side == Side.RIGHT:
+            self.process_interaction(RIGHT, up, down)
+
+    def process_interaction(self, index: int, up: bool, down: bool) -> None:
+        """Processa a interação do jogador com a raquete do índice informado"""
+        values = self.state.values
+        velocity = PADDLE_VY[index]
+        acceleration = PADDLE_ACCELERATION[index]
+
+        if down and not up:
+            if values[velocity] > 0:
+                values[acceleration] += self.settings.paddle_acceleration_increment
+            else:
+                values[acceleration] = self.settings.paddle_acceleration
+
+            values[velocity] = self.settings.paddle_speed * values[acceleration]
+        elif up and not down:
+            if values[velocity] < 0:
+                values[acceleration] += self.settings.paddle_acceleration_increment
+            else:
+                values[acceleration] = self.settings.paddle_acceleration
+
+            values[velocity] = (self.settings.paddle_speed * values[acceleration]) * -1
+        else:
+            values[velocity] = 0.0
+            values[acceleration] = self.settings.paddle_acceleration
+
+    def update_paddle(self, index: int, dt: float) -> None:
+        """Atualiza o estado da raquete do índice informado"""
+        values = self.state.values
+        position = PADDLE_Y[index]
+        velocity = values[PADDLE_VY[index]]
+        top = values[position] + round(velocity * dt)
+
+        if self.paddle_top_min <= top <= self.paddle_top_max:
+            values[position] = top
+        else:
+            if velocity < 0:
+                values[position] = self.paddle_top_min
+            elif velocity > 0:
+                values[position] = self.paddle_top_max
+
+    def update_ball(self, dt: float) -> None:
+        """Atualiza o estado da bola"""
+        values = self.state.values
+
+        if values[BALL_STATE] == READY:
+            self.handle_ready_state(dt)
+        elif values[BALL_STATE] == RUNNING:
+            self.handle_playing_state(dt)
+
+    def handle_ready_state(self, dt: float) -> None:
+        """Gerencia a bola em espera"""
+        values = self.state.values
+        values[BALL_ACCUMULATOR] += dt
+
+        if values[BALL_ACCUMULATOR] < self.settings.ball_ready_time_appear:
+            pass
+        elif values[BALL_ACCUMULATOR] < self.settings.ball_ready_time_settledown:
+            self.reset_ball_position()
+        elif values[BALL_ACCUMULATOR] < self.settings.ball_ready_time_play:
+            pass
+        else:
+            self.reset_ball_velocity()
+            values[BALL_ACCUMULATOR] = 0.0
+            values[BALL_STATE] = RUNNING
+
+    def handle_playing_state(self, dt: float) -> None:
+        """Gerencia a bola em jogo"""
+        values = self.state.values
+        values[BALL_X] += round(values[BALL_VX] * dt)
+        values[BALL_Y] += round(values[BALL_VY] * dt)
+
+    def reset_ball_position(self) -> None:
+        """Reconfigura a posição da bola"""
+        y = self.draw().randrange(
+            self.bounds.top + (self.settings.wall_size * 2),
+            self.bounds.bottom,
+            self.settings.ball_size * 2,
+        )
+
+        values = self.state.values
+        values[BALL_X] = self.bounds.centerx - self.ball.rect.width // 2
+        values[BALL_Y] = y - self.ball.rect.height // 2
+        values[PREVIOUS_BALL_X] = values[BALL_X]
+        values[PREVIOUS_BALL_Y] = values[BALL_Y]
+        self.events.append(Event.START)
+
+    def reset_ball_velocity(self) -> None:
+        """Reinicia o vetor velocidade da bola"""
+        generator = self.draw()
+        degrees = generator.uniform(-self.settings.ball_angle_max, self.settings.ball_angle_max)
+
+        if generator.choice([-1, 1]) == -1:
+            degrees += 180
+
+        values = self.state.values
+        values[BALL_VX], values[BALL_VY] = self.configure_velocity(degrees)
+        values[BALL_ACCELERATION] = self.settings.ball_acceleration
+
+    def stroke(self, collision_point: float, side: Side) -> None:
+        """Gerencia a rebatida da bola"""
+        values = self.state.values
+        degrees = self.settings.ball_angle_max * (collision_point / (self.settings.paddle_height / 2))
+
+        if side == Side.RIGHT:
+            degrees *= -1
+
+        if values[BALL_VX] < 0:
+            degrees += 180
+
+        dx, dy = self.configure_velocity(degrees)
+        values[BALL_VX] = dx * values[BALL_ACCELERATION]
+        values[BALL_VY] = dy * values[BALL_ACCELERATION]
+
+        if math.hypot(values[BALL_VX], values[BALL_VY]) <= self.settings.ball_speed_max:
+            values[BALL_ACCELERATION] += self.settings.ball_acceleration_increment
+
+    def configure_velocity(self, degrees: float) -> tuple[float, float]:
+        """Configura o vetor velocidade da bola"""
+        radians = math.radians(degrees)
+        dx = self.settings.ball_speed * math.cos(radians)
+        dy = self.settings.ball_speed * math.sin(radians)
+
+        return dx, dy
+
+    def handle_goal(self, side: Side) -> None:
+        """Gerencia a atualização do placar"""
+        values = self.state.values
+
+        if side == Side.LEFT:
+            values[SCORE[RIGHT]] += 1
+        elif side == Side.RIGHT:
+            values[SCORE[LEFT]] += 1
+
+        if values[SCORE[LEFT]] >= self.settings.game_points_max or values[SCORE[RIGHT]] >= self.settings.game_points_max:
+            self.handle_endgame()
+        else:
+            self.events.append(Event.SCORE)
+            values[BALL_STATE] = READY
+
+    def handle_endgame(self) -> None:
+        """Gerencia o fim do jogo"""
+        values = self.state.values
+        self.events.append(Event.WINNER)
+        values[BALL_STATE] = WAITING
+
+        if values[SCORE[LEFT]] > values[SCORE[RIGHT]]:
+            values[WINNER] = LEFT
+        else:
+            values[WINNER] = RIGHT
+
+    def restart(self) -> None:
+        """Reinicia a partida"""
+        if self.recorder is not None:
+            self.recorder.mark_restart()
+
+        values = self.state.values
+        values[SCORE[LEFT]] = 0
+        values[SCORE[RIGHT]] = 0
+        values[BALL_STATE] = READY
+        values[WINNER] = NO_WINNER
+
+        if self.multiball is not None:
+            self.multiball.reset()
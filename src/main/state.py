@@ -0,0 +1,43 @@
+# state.py
+
+from array import array
+
+# Posições dos valores no bloco de estado
+BALL_X = 0
+BALL_Y = 1
+BALL_VX = 2
+BALL_VY = 3
+BALL_ACCELERATION = 4
+BALL_STATE = 5
+BALL_ACCUMULATOR = 6
+PADDLE_Y = (7, 8)
+PADDLE_VY = (9, 10)
+PADDLE_ACCELERATION = (11, 12)
+SCORE = (13, 14)
+WINNER = 15
+ACCUMULATOR = 16
+STEPS = 17
+DRAWS = 18
+PREVIOUS_BALL_X = 19
+PREVIOUS_BALL_Y = 20
+PREVIOUS_PADDLE_Y = (21, 22)
+PADDLE_ACCUMULATOR = 23
+SIZE = 24
+
+
+class State:
+    """Define o estado dinâmico de uma partida em um único bloco contíguo de números"""
+
+    __slots__ = ["values"]
+
+    def __init__(self) -> None:
+        """Inicializa o bloco de estado zerado"""
+        self.values = array("d", [0.0]) * SIZE
+
+    def snapshot(self) -> array:
+        """Retorna uma cópia do bloco de estado"""
+        return self.values[:]
+
+    def restore(self, snapshot: array) -> None:
+        """Sobrescreve o bloco de estado com uma cópia tirada antes"""
+        self.values[:] = snapshot
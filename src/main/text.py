@@ -0,0 +1,28 @@
+# text.py
+
+import pygame
+
+
+class Text(pygame.sprite.DirtySprite):
+    """Define uma instância de um texto"""
+
+    def __init__(self, image: pygame.surface.Surface, x: int, y: int) -> None:
+        """Inicializa uma instância de um texto"""
+        super().__init__()
+        self._layer = 0
+        self.x = x
+        self.y = y
+        self.set_image(image)
+
+    def set_image(self, image: pygame.surface.Surface) -> None:
+        """Atualiza a imagem do texto"""
+        self.image = image
+        self.rect = self.image.get_rect()
+        self.place(self.x, self.y)
+
+    def place(self, x: int, y: int) -> None:
+        """Posiciona o centro do texto na tela"""
+        self.x = x
+        self.y = y
+        self.rect.center = (self.x, self.y)
+        self.dirty = 1
@@ -0,0 +1,63 @@
+# text_cache.py
+
+import threading
+from collections import OrderedDict
+
+import pygame
+from settings import Settings
+
+
+class TextCache:
+    """Define um cache de textos renderizados, compartilhado entre as cenas"""
+
+    def __init__(self, settings: Settings) -> None:
+        """Inicializa o cache de textos"""
+        self.settings = settings
+        self.capacity = self.settings.text_cache_capacity
+        self.fonts: dict[tuple[str, int], pygame.font.Font] = {}
+        self.surfaces: OrderedDict[tuple[str, int, str, tuple[int, ...]], pygame.surface.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Cenas construídas em segundo plano usam o cache ao mesmo tempo que a tela
+        self.lock = threading.RLock()
+
+    def get_font(self, family: str, size: int) -> pygame.font.Font:
+        """Retorna a fonte, abrindo o arquivo apenas na primeira vez"""
+        key = (family, size)
+
+        with self.lock:
+            if key not in self.fonts:
+                self.fonts[key] = pygame.font.Font(family, size)
+
+            return self.fonts[key]
+
+    def render(self, text: str, family: str, size: int, color: tuple[int, ...]) -> pygame.surface.Surface:
+        """Retorna o texto renderizado, renderizando-o apenas se não estiver no cache"""
+        key = (family, size, text, color)
+
+        with self.lock:
+            surface = self.surfaces.get(key)
+
+            if surface is not None:
+                self.hits += 1
+                self.surfaces.move_to_end(key)
+                return surface
+
+            self.misses += 1
+            surface = self.get_font(family, size).render(text, True, color)
+            self.surfaces[key] = surface
+
+            if len(self.surfaces) > self.capacity:
+                self.surfaces.popitem(last=False)
+
+            return surface
+
+    def preload(self, texts: list[str], family: str, size: int, color: tuple[int, ...]) -> None:
+        """Renderiza antecipadamente uma lista de textos"""
+        for text in texts:
+            if (family, size, text, color) not in self.surfaces:
+                self.render(text, family, size, color)
+
+    def stats(self) -> dict:
+        """Retorna as estatísticas de uso do cache"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces), "fonts": len(self.fonts)}
@@ -0,0 +1,234 @@
+# tournament.py
+
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from computer_player import DIFFICULTIES, ComputerPlayer  # noqa: E402
+from event import Event  # noqa: E402
+from settings import Settings  # noqa: E402
+from side import Side  # noqa: E402
+from simulation import Simulation  # noqa: E402
+from state import BALL_VX, BALL_VY  # noqa: E402
+
+FRAME = 1 / 60
+BINS = 10
+
+
+def play_match(settings: Settings, seed: int, difficulty: str, seconds_max: float) -> dict:
+    """Joga uma partida sem tela entre dois jogadores do computador e retorna as medidas dela"""
+    simulation = Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, seed)
+    players = [
+        ComputerPlayer(simulation, side, *DIFFICULTIES[difficulty], seed=seed * 2 + side.value)
+        for side in [Side.LEFT, Side.RIGHT]
+    ]
+    values = simulation.state.values
+    rallies = []
+    speeds = []
+    strokes = 0
+    frames = 0
+
+    def sample(dt: float) -> None:
+        """Joga antes de cada passo da física, como na partida com tela"""
+        for player in players:
+            player.play(dt)
+
+    while simulation.winner is None and frames * FRAME < seconds_max:
+        direction = values[BALL_VX] > 0
+        simulation.advance(FRAME, sample)
+        frames += 1
+
+        # Uma rebatida inverte o sentido horizontal da bola
+        if Event.COLLISION in simulation.events and (values[BALL_VX] > 0) != direction:
+            strokes += 1
+            speeds.append(math.hypot(values[BALL_VX], values[BALL_VY]))
+
+        if Event.SCORE in simulation.events or Event.WINNER in simulation.events:
+            rallies.append(strokes)
+            strokes = 0
+
+    return {
+        "duration": frames * FRAME,
+        "rallies": rallies,
+        "speeds": speeds,
+        "winner": None if simulation.winner is None else simulation.winner.name.lower(),
+    }
+
+
+def evaluate(task: tuple[str, dict, dict, int, int, str, float]) -> dict:
+    """Joga as partidas de uma configuração e retorna as medidas agregadas"""
+    key, overrides, base, matches, seed, difficulty, seconds_max = task
+    settings = Settings.from_dict({**base, **overrides})
+    results = [play_match(settings, seed + match, difficulty, seconds_max) for match in range(matches)]
+    rallies = np.array([rally for result in results for rally in result["rallies"]], dtype=float)
+    speeds = np.array([speed for result in results for speed in result["speeds"]], dtype=float)
+    durations = np.array([result["duration"] for result in results])
+    winners = [result["winner"] for result in results]
+    counts, edges = np.histogram(speeds, bins=BINS, range=(settings.ball_speed, max(settings.ball_speed_max, 1.0)))
+
+    return {
+        "key": key,
+        "overrides": overrides,
+        "matches": matches,
+        "rally": summarize(rallies),
+        "duration": summarize(durations),
+        "speed": {**summarize(speeds), "histogram": {"counts": counts.tolist(), "edges": edges.tolist()}},
+        "wins": {"left": winners.count("left"), "right": winners.count("right"), "unfinished": winners.count(None)},
+    }
+
+
+def summarize(values: np.ndarray) -> dict:
+    """Resume uma série de medidas pela média e pelos percentis"""
+    if len(values) == 0:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "max": 0.0}
+
+    p50, p90 = np.percentile(values, [50, 90])
+    return {"mean": float(values.mean()), "p50": float(p50), "p90": float(p90), "max": float(values.max())}
+
+
+def parse_value(text: str):
+    """Converte um valor da linha de comando no tipo do arquivo de configurações"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def build_grid(options: list[str]) -> list[dict]:
+    """Retorna todas as combinações de valores das opções chave=v1,v2,..."""
+    keys = []
+    choices = []
+
+    for option in options:
+        key, _, text = option.partition("=")
+        keys.append(key)
+        choices.append([parse_value(value) for value in text.split(",")])
+
+    return [dict(zip(keys, combination)) for combination in itertools.product(*choices)]
+
+
+def build_sample(options: list[str], count: int, seed: int) -> list[dict]:
+    """Retorna combinações sorteadas uniformemente nos intervalos das opções chave=mínimo:máximo"""
+    generator = random.Random(seed)
+    ranges = []
+
+    for option in options:
+        key, _, text = option.partition("=")
+        low, high = (parse_value(value) for value in text.split(":"))
+        ranges.append((key, low, high))
+
+    configurations = []
+
+    for _ in range(count):
+        overrides = {}
+
+        for key, low, high in ranges:
+            if isinstance(low, int) and isinstance(high, int):
+                overrides[key] = generator.randint(low, high)
+            else:
+                overrides[key] = round(generator.uniform(low, high), 4)
+
+        configurations.append(overrides)
+
+    return configurations
+
+
+def to_key(overrides: dict) -> str:
+    """Retorna o identificador estável de uma configuração"""
+    return json.dumps(overrides, sort_keys=True)
+
+
+def load_done(path: str) -> set[str]:
+    """Retorna as configurações já concluídas no arquivo de resultados, ignorando uma linha interrompida"""
+    done = set()
+
+    if not os.path.exists(path):
+        return done
+
+    with open(path, "r") as file:
+        for line in file:
+            try:
+                done.add(json.loads(line)["key"])
+            except (json.JSONDecodeError, KeyError):
+                continue
+
+    return done
+
+
+def run(
+    configurations: list[dict],
+    base: dict,
+    output: str,
+    matches: int,
+    seed: int = 0,
+    difficulty: str = "normal",
+    seconds_max: float = 600.0,
+    workers: int | None = None,
+) -> int:
+    """Joga as configurações ainda não concluídas em paralelo e grava cada resultado assim que termina"""
+    done = load_done(output)
+    tasks = []
+
+    for overrides in configurations:
+        key = to_key(overrides)
+
+        if key not in done:
+            # Valida antes de começar, para não descobrir um erro de digitação no meio da varredura
+            Settings.from_dict({**base, **overrides})
+            done.add(key)
+            tasks.append((key, overrides, base, matches, seed, difficulty, seconds_max))
+
+    if not tasks:
+        return 0
+
+    with multiprocessing.Pool(workers) as pool, open(output, "a") as file:
+        for result in pool.imap_unordered(evaluate, tasks):
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+            print(f"{result['key']}: rally {result['rally']['mean']:.1f} duration {result['duration']['mean']:.0f}s")
+
+    return len(tasks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Joga partidas entre computadores para comparar configurações")
+    parser.add_argument("--grid", action="append", default=[], help="chave=v1,v2,... para testar todas as combinações")
+    parser.add_argument("--range", action="append", default=[], help="chave=mínimo:máximo para sortear valores")
+    parser.add_argument("--sample", type=int, default=0, help="número de configurações sorteadas com --range")
+    parser.add_argument("--matches", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--difficulty", choices=list(DIFFICULTIES), default="normal")
+    parser.add_argument("--seconds-max", type=float, default=600.0, help="duração máxima de cada partida")
+    parser.add_argument("--workers", type=int, default=None, help="processos; por padrão, um por núcleo")
+    parser.add_argument("--settings", default="config/settings.json")
+    parser.add_argument("--output", default="tournament.jsonl")
+    arguments = parser.parse_args()
+
+    configurations = build_grid(arguments.grid) if arguments.grid else [{}]
+
+    if arguments.range:
+        configurations = [
+            {**grid, **sample}
+            for grid in configurations
+            for sample in build_sample(arguments.range, arguments.sample, arguments.seed)
+        ]
+
+    count = run(
+        configurations,
+        Settings.load(arguments.settings).to_dict(),
+        arguments.output,
+        arguments.matches,
+        arguments.seed,
+        arguments.difficulty,
+        arguments.seconds_max,
+        arguments.workers,
+    )
+    print(f"{count} configurations played, {len(configurations) - count} already in {arguments.output}")
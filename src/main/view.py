@@ -0,0 +1,31 @@
+# view.py
+
+import pygame
+from settings import Settings
+
+
+class View:
+    """Define a conversão das unidades lógicas da simulação para os pixels da superfície de renderização"""
+
+    def __init__(self, settings: Settings) -> None:
+        """Inicializa a conversão com as escalas da resolução interna configurada"""
+        self.scale_x = settings.render_scale_x
+        self.scale_y = settings.render_scale_y
+
+    def x(self, value: float) -> int:
+        """Converte uma coordenada horizontal"""
+        return round(value * self.scale_x)
+
+    def y(self, value: float) -> int:
+        """Converte uma coordenada vertical"""
+        return round(value * self.scale_y)
+
+    def rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """Converte uma área pelos cantos, para que áreas vizinhas continuem encostadas"""
+        left = self.x(rect.left)
+        top = self.y(rect.top)
+        return pygame.Rect(left, top, max(1, self.x(rect.right) - left), max(1, self.y(rect.bottom) - top))
+
+    def font_size(self, size: int) -> int:
+        """Converte o tamanho de uma fonte"""
+        return max(1, round(size * self.scale_y))
@@ -0,0 +1,281 @@
+# benchmark.py
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT, "src", "main"))
+
+import pygame  # noqa: E402
+from audio import Audio  # noqa: E402
+from ball_state import BallState  # noqa: E402
+from game import Game  # noqa: E402
+from menu import Menu  # noqa: E402
+from pong import Pong  # noqa: E402
+from scene import Scene  # noqa: E402
+from settings import Settings  # noqa: E402
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y  # noqa: E402
+from text_cache import TextCache  # noqa: E402
+
+NOISE_MS = 0.1
+BASELINE = os.environ.get("PONG_BENCHMARK_BASELINE", os.path.join(ROOT, "src", "test", "benchmark_baseline.json"))
+SPEEDS = [500, 1500, 2500]
+SIZES = [(1920, 1080), (960, 540), (480, 270)]
+MODES = ["full", "dirty"]
+
+
+def load_settings() -> Settings:
+    """Carrega as configurações do jogo"""
+    return Settings.load(os.path.join(ROOT, "config", "settings.json"))
+
+
+def measure(function, duration: float, rounds: int = 5) -> float:
+    """Executa a função repetidamente pelo tempo indicado e retorna a melhor taxa de execuções por segundo"""
+    best = 0.0
+
+    for _ in range(rounds):
+        count = 0
+        start = time.perf_counter()
+
+        while time.perf_counter() - start < duration / rounds:
+            count += function() or 1
+
+        best = max(best, count / (time.perf_counter() - start))
+
+    return best
+
+
+def present(rects: list[pygame.Rect] | None) -> None:
+    """Apresenta o quadro como o Pong faria"""
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+
+def resize(settings: Settings, size: tuple[int, int]) -> Settings:
+    """Retorna as configurações para uma resolução interna do tamanho indicado"""
+    return settings.replace(render_width=size[0], render_height=size[1])
+
+
+def build_game(settings: Settings) -> Game:
+    """Constrói uma sessão do jogo em uma tela do tamanho configurado"""
+    screen = pygame.display.set_mode(settings.render_size)
+    game = Game(screen, settings, TextCache(settings), Audio(settings))
+    game.reset()
+    return game
+
+
+def keep_rally(game: Game, speed: float) -> None:
+    """Mantém a bola em jogo na velocidade indicada, alinhando as raquetes a ela"""
+    simulation = game.simulation
+    values = simulation.state.values
+
+    if simulation.ball_state != BallState.RUNNING:
+        values[BALL_STATE] = BallState.RUNNING.value
+        values[BALL_X] = simulation.bounds.centerx
+        values[BALL_Y] = simulation.bounds.centery
+        values[BALL_VX] = math.cos(math.radians(30))
+        values[BALL_VY] = math.sin(math.radians(30))
+
+    scale = speed / math.hypot(values[BALL_VX], values[BALL_VY])
+    values[BALL_VX] *= scale
+    values[BALL_VY] *= scale
+
+    for paddle in simulation.paddles:
+        values[PADDLE_Y[paddle.side.value]] = values[BALL_Y] - (paddle.rect.height // 2)
+
+
+def bench_logic(settings: Settings, duration: float) -> dict:
+    """Mede os passos de física por segundo em várias velocidades da bola"""
+    results = {}
+
+    for speed in SPEEDS:
+        game = build_game(settings)
+        time_step = game.simulation.time_step
+
+        def run() -> int:
+            keep_rally(game, speed)
+            game.process_logic(time_step)
+            return game.simulation.substeps
+
+        results[f"logic_steps_per_second_{speed}"] = measure(run, duration)
+
+    return results
+
+
+def bench_frames(settings: Settings, duration: float) -> dict:
+    """Mede os quadros por segundo do jogo e do menu em vários tamanhos de tela"""
+    results = {}
+
+    for mode in MODES:
+        for size in SIZES:
+            name = f"{size[0]}x{size[1]}_{mode}"
+            sized = resize(settings.replace(render_mode=mode), size)
+            game = build_game(sized)
+
+            def run_game() -> None:
+                keep_rally(game, sized.ball_speed)
+                game.process_logic(1.0 / sized.game_fps)
+                present(game.process_frames())
+
+            results[f"game_frames_per_second_{name}"] = measure(run_game, duration)
+
+            menu = Menu(pygame.display.get_surface(), sized, TextCache(sized), Audio(sized))
+
+            def run_menu() -> None:
+                menu.process_logic(1.0 / sized.game_fps)
+                present(menu.process_frames())
+
+            results[f"menu_frames_per_second_{name}"] = measure(run_menu, duration)
+
+    return results
+
+
+def bench_startup(settings: Settings, repeat: int) -> dict:
+    """Mede a construção do jogo e a troca de cenas"""
+    screen = pygame.display.set_mode(settings.render_size)
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Game(screen, settings, TextCache(settings), Audio(settings))
+        timings.append(time.perf_counter() - start)
+
+    results = {"game_init_ms": min(timings) * 1000}
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+
+    try:
+        pong = Pong()
+        pong.settings = pong.settings.replace(scene_warmup=False)
+        timings = []
+
+        for _ in range(repeat):
+            pong.scenes.get(Scene.GAME)
+            pong.scenes.scenes.pop(Scene.GAME)
+            start = time.perf_counter()
+            pong.change_scene(Scene.GAME)
+            timings.append(time.perf_counter() - start)
+            pong.change_scene(Scene.MENU)
+
+        results["change_scene_first_ms"] = min(timings) * 1000
+        timings = []
+
+        for _ in range(repeat):
+            for scene_name in [Scene.MENU, Scene.GAME]:
+                start = time.perf_counter()
+                pong.change_scene(scene_name)
+                timings.append(time.perf_counter() - start)
+
+        results["change_scene_ms"] = min(timings) * 1000
+        pong.scene.suspend()
+    finally:
+        os.chdir(cwd)
+
+    return results
+
+
+def bench_memory(settings: Settings, frames: int) -> dict:
+    """Mede o pico de memória alocada ao construir o jogo e processar quadros"""
+    tracemalloc.start()
+
+    try:
+        game = build_game(settings)
+
+        for _ in range(frames):
+            keep_rally(game, settings.ball_speed)
+            game.process_logic(1.0 / settings.game_fps)
+            present(game.process_frames())
+
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"game_peak_memory_bytes": peak}
+
+
+def run(duration: float = 0.5) -> dict:
+    """Executa todas as medições e retorna as métricas"""
+    pygame.init()
+    settings = load_settings()
+
+    try:
+        results = {}
+        results.update(bench_logic(settings, duration))
+        results.update(bench_frames(settings, duration))
+        results.update(bench_startup(settings, 5))
+        results.update(bench_memory(settings, 300))
+    finally:
+        pygame.quit()
+
+    return results
+
+
+def is_higher_better(metric: str) -> bool:
+    """Indica se valores maiores da métrica são melhores"""
+    return "_per_second" in metric
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Compara as métricas com a linha de base e retorna as regressões acima do limite"""
+    regressions = []
+
+    for metric, reference in baseline.items():
+        if metric not in results or reference <= 0:
+            continue
+
+        value = results[metric]
+
+        if is_higher_better(metric):
+            regressed = value < reference * (1.0 - threshold)
+        else:
+            # Tempos abaixo de um décimo de milissegundo estão dentro do ruído do relógio
+            regressed = value > reference * (1.0 + threshold) and not (metric.endswith("_ms") and value < NOISE_MS)
+
+        if regressed:
+            change = (value - reference) / reference * 100
+            regressions.append(f"{metric}: {value:.2f} vs baseline {reference:.2f} ({change:+.1f}%)")
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Executa as medições de desempenho do jogo")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--duration", type=float, default=0.5)
+    parser.add_argument("--update", action="store_true", help="grava os resultados como nova linha de base")
+    arguments = parser.parse_args()
+
+    results = run(arguments.duration)
+
+    for metric, value in results.items():
+        print(f"{metric:<45} {value:14.4f}")
+
+    if arguments.update:
+        with open(arguments.baseline, "w") as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+
+        raise SystemExit(0)
+
+    if not os.path.exists(arguments.baseline):
+        print(f"No baseline at {arguments.baseline}; run with --update to create one")
+        raise SystemExit(0)
+
+    with open(arguments.baseline, "r") as file:
+        regressions = compare(results, json.load(file), arguments.threshold)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    raise SystemExit(1 if regressions else 0)
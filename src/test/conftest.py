@@ -0,0 +1,8 @@
+# conftest.py
+
+import os
+import sys
+
+TEST = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TEST)
+sys.path.insert(0, os.path.join(os.path.dirname(TEST), "main"))
@@ -0,0 +1,55 @@
+# test_batch_simulation.py
+
+import os
+import random
+
+import numpy as np
+import pygame
+from batch_simulation import BatchSimulation
+from ball_state import BallState
+from settings import Settings
+from side import Side
+from simulation import RUNNING, Simulation
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_batch_matches_simulation() -> None:
+    """Reproduz passo a passo os mesmos ralis da simulação escalar, com as mesmas entradas e saques"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json"))
+    bounds = pygame.Rect(0, 0, settings.screen_width, settings.screen_height)
+
+    for rally in range(200):
+        inputs = random.Random(rally)
+        simulation = Simulation(bounds, settings, rally)
+        batch = BatchSimulation(bounds, settings, 1)
+        values = simulation.state.values
+
+        # Mesmo saque nas duas simulações
+        values[BALL_STATE] = RUNNING
+        values[BALL_X] = bounds.centerx - settings.ball_size // 2
+        values[BALL_Y] = inputs.randrange(30, bounds.height - 30)
+        simulation.reset_ball_velocity()
+        batch.ball_state[:] = RUNNING
+        batch.ball_x[:] = values[BALL_X]
+        batch.ball_y[:] = values[BALL_Y]
+        batch.ball_vx[:] = values[BALL_VX]
+        batch.ball_vy[:] = values[BALL_VY]
+
+        for _ in range(3000):
+            keys = [inputs.random() < 0.3 for _ in range(4)]
+            simulation.set_direction(Side.LEFT, keys[0], keys[1])
+            simulation.set_direction(Side.RIGHT, keys[2], keys[3])
+            batch.set_directions(np.array([[keys[0], keys[2]]]), np.array([[keys[1], keys[3]]]))
+            simulation.step()
+            batch.step()
+
+            if simulation.ball_state != BallState.RUNNING:
+                break
+
+            assert (values[BALL_X], values[BALL_Y]) == (batch.ball_x[0], batch.ball_y[0])
+            assert (values[PADDLE_Y[0]], values[PADDLE_Y[1]]) == tuple(batch.paddles_y[0])
+            assert abs(values[BALL_VX] - batch.ball_vx[0]) < 1e-6
+
+        assert (simulation.left_score, simulation.right_score) == tuple(batch.scores[0])
@@ -0,0 +1,23 @@
+# test_benchmark.py
+
+import json
+import os
+
+import pytest
+from benchmark import BASELINE, compare, run
+
+
+def test_benchmark_regressions() -> None:
+    """Falha quando alguma métrica piora além do limite em relação à linha de base"""
+    if not os.path.exists(BASELINE):
+        pytest.skip("no benchmark baseline; create one with python src/test/benchmark.py --update")
+
+    with open(BASELINE, "r") as file:
+        baseline = json.load(file)
+
+    # A linha de base versionada vem de outra máquina, então só pega regressões grosseiras por padrão
+    threshold = float(os.environ.get("PONG_BENCHMARK_THRESHOLD", "0.5"))
+    results = run(float(os.environ.get("PONG_BENCHMARK_DURATION", "0.5")))
+    regressions = compare(results, baseline, threshold)
+
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,62 @@
+# test_computer_player.py
+
+import os
+import random
+
+import pygame
+from computer_player import DIFFICULTIES, ComputerPlayer
+from event import Event
+from settings import Settings
+from side import Side
+from simulation import RUNNING, Simulation
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_simulation(seed: int) -> Simulation:
+    """Constrói uma simulação do tamanho da tela configurada"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json"))
+    return Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, seed)
+
+
+def test_intercept_matches_simulated_crossing() -> None:
+    """Prevê em forma fechada, com as reflexões nas paredes, a altura em que a bola cruza a raquete"""
+    inputs = random.Random(1)
+
+    for _ in range(50):
+        simulation = build_simulation(1)
+        computer = ComputerPlayer(simulation, Side.RIGHT, 0.0, 0.0)
+        values = simulation.state.values
+        values[BALL_STATE] = RUNNING
+        values[BALL_X] = simulation.bounds.centerx
+        values[BALL_Y] = inputs.randrange(100, simulation.bounds.height - 100)
+        values[BALL_VX] = inputs.uniform(300, 900)
+        values[BALL_VY] = inputs.uniform(-1500, 1500)
+        # Raquete fora do caminho, para a bola cruzar o plano
+        values[PADDLE_Y[1]] = -1000
+        predicted = computer.intercept()
+
+        while values[BALL_X] < computer.plane:
+            simulation.step()
+
+        crossed = values[BALL_Y] + simulation.settings.ball_size / 2
+
+        assert abs(predicted - crossed) <= 40
+
+
+def test_hard_computers_keep_rallies_going() -> None:
+    """Sustenta ralis longos entre dois jogadores difíceis"""
+    simulation = build_simulation(2)
+    players = [ComputerPlayer(simulation, side, *DIFFICULTIES["hard"], seed=1) for side in [Side.LEFT, Side.RIGHT]]
+    collisions = 0
+
+    for _ in range(60 * 60):
+        for player in players:
+            player.play(1 / 60)
+
+        simulation.advance(1 / 60)
+        collisions += simulation.events.count(Event.COLLISION)
+
+    assert collisions > 4 * (simulation.left_score + simulation.right_score + 1)
+    assert players[0].plans > 0
@@ -0,0 +1,71 @@
+# test_environment.py
+
+import math
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from environment import Environment  # noqa: E402
+from settings import Settings  # noqa: E402
+from side import Side  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_settings(**changes) -> Settings:
+    """Carrega as configurações do jogo com as alterações indicadas"""
+    return Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(**changes)
+
+
+def test_pixels_are_a_view_of_the_screen() -> None:
+    """Retorna a própria memória da tela a cada passo, com o que foi desenhado nela"""
+    environment = Environment(load_settings(render_width=320, render_height=180), observation="pixels")
+    first, _ = environment.reset(3)
+
+    for _ in range(30):
+        observation, *_ = environment.step(1)
+
+    assert observation is first
+    assert np.shares_memory(observation, environment.buffer)
+    assert observation.shape == (180, 320, 3)
+    assert np.array_equal(observation, pygame.surfarray.array3d(environment.screen).transpose(1, 0, 2))
+
+
+def test_rewards_follow_the_score_until_the_end() -> None:
+    """Soma as recompensas dos gols até o vencedor e avança frame_skip passos por ação"""
+    environment = Environment(load_settings(), side=Side.LEFT, frame_skip=3, difficulty="hard")
+    observation, info = environment.reset(5)
+    total = 0.0
+    terminated = False
+    actions = 0
+
+    assert observation.shape == environment.observation_shape
+
+    while not terminated:
+        observation, reward, terminated, truncated, info = environment.step(actions % environment.action_count)
+        total += reward
+        actions += 1
+
+        assert not truncated
+
+    assert total == info["score"] - info["opponent_score"] < 0
+    assert environment.simulation.steps == info["steps"] <= actions * 3
+
+
+def test_episode_is_truncated_at_the_time_limit() -> None:
+    """Interrompe o episódio na duração máxima informada"""
+    settings = load_settings()
+    environment = Environment(settings, frame_skip=4, seconds_max=1.0)
+    environment.reset(1)
+    truncated = False
+    actions = 0
+
+    while not truncated:
+        _, _, terminated, truncated, info = environment.step(0)
+        actions += 1
+
+    assert not terminated
+    assert actions == math.ceil(round(1.0 / settings.time_step) / 4)
@@ -0,0 +1,96 @@
+# test_keyboard.py
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from audio import Audio  # noqa: E402
+from game import Game  # noqa: E402
+from keyboard import Keyboard  # noqa: E402
+from settings import Settings  # noqa: E402
+from side import Side  # noqa: E402
+from simulation import Simulation  # noqa: E402
+from state import PADDLE_Y  # noqa: E402
+from text_cache import TextCache  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Clock:
+    """Define um relógio controlado pelo teste"""
+
+    def __init__(self) -> None:
+        """Inicializa o relógio no instante zero"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Retorna o instante atual"""
+        return self.now
+
+
+def build_game(clock: Clock) -> Game:
+    """Constrói uma sessão do jogo com o teclado no relógio informado"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json"))
+    pygame.init()
+    screen = pygame.display.set_mode((64, 36))
+    game = Game(screen, settings, TextCache(settings), Audio(settings), Keyboard(settings, clock))
+    game.reset(1)
+    pygame.event.clear()
+    return game
+
+
+def press(game: Game, key: int) -> None:
+    """Põe uma tecla pressionada na fila e deixa o jogo lê-la"""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    game.process_events()
+
+
+def test_acceleration_does_not_depend_on_frame_rate() -> None:
+    """Leva a raquete ao mesmo lugar com a tecla segurada pelo mesmo tempo, a qualquer taxa de quadros"""
+    positions = set()
+
+    for fps in [30, 60, 120]:
+        clock = Clock()
+        game = build_game(clock)
+        start = game.simulation.state.values[PADDLE_Y[1]]
+        press(game, pygame.K_DOWN)
+
+        for _ in range(fps // 2):
+            clock.now += 1 / fps
+            game.process_logic(1 / fps)
+
+        assert game.simulation.steps == round(0.5 / game.settings.time_step)
+        positions.add(game.simulation.state.values[PADDLE_Y[1]] - start)
+
+    assert len(positions) == 1
+    assert positions.pop() > 0
+
+
+def test_key_is_applied_at_its_physics_step() -> None:
+    """Começa o movimento no passo em que a tecla chegou, não no início do quadro, e mede a latência"""
+    clock = Clock()
+    game = build_game(clock)
+    time_step = game.settings.time_step
+    reference = Simulation(game.simulation.bounds, game.settings, 1)
+
+    # A tecla chega pouco antes do segundo dos quatro passos do quadro
+    clock.now = 1.9 * time_step
+    press(game, pygame.K_w)
+    clock.now = 4 * time_step
+    game.process_logic(4 * time_step)
+
+    for step in range(4):
+        reference.set_direction(Side.LEFT, step > 0, False)
+        reference.step()
+
+    assert game.simulation.state.values[PADDLE_Y[0]] == reference.state.values[PADDLE_Y[0]]
+    assert game.simulation.state.values[PADDLE_Y[0]] < reference.paddle_top_max
+
+    clock.now = 5 * time_step
+    game.keyboard.presented()
+    stats = game.keyboard.stats()
+
+    assert stats["presses"] == 1
+    assert abs(stats["latency_ms"] - 3.1 * time_step * 1000) < 1e-6
@@ -0,0 +1,88 @@
+# test_multiball.py
+
+import itertools
+import os
+
+import numpy as np
+import pygame
+from ball_state import BallState
+from event import Event
+from multiball import Multiball
+from settings import Settings
+from simulation import Simulation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_multiball(count: int, collisions: bool, seed: int) -> Multiball:
+    """Constrói uma simulação com bolas extras do tamanho da tela configurada"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(
+        ball_count=count, ball_collisions=collisions
+    )
+    simulation = Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, seed)
+    return Multiball(simulation)
+
+
+def test_grid_finds_every_touching_pair() -> None:
+    """Encontra pela grade os mesmos contatos que a comparação de todos os pares, olhando poucos pares"""
+    multiball = build_multiball(400, True, 1)
+    generator = np.random.default_rng(1)
+    bounds = multiball.simulation.bounds
+    x = generator.integers(0, bounds.width, 400).astype(float)
+    y = generator.integers(0, bounds.height, 400).astype(float)
+    first, second = multiball.find_pairs(x, y, np.arange(400))
+    size = multiball.size
+    found = {
+        tuple(sorted(pair))
+        for pair in zip(first.tolist(), second.tolist())
+        if abs(x[pair[0]] - x[pair[1]]) < size and abs(y[pair[0]] - y[pair[1]]) < size
+    }
+    expected = {
+        (i, j)
+        for i, j in itertools.combinations(range(400), 2)
+        if abs(x[i] - x[j]) < size and abs(y[i] - y[j]) < size
+    }
+
+    assert found == expected
+    assert len(set(zip(first.tolist(), second.tolist()))) == len(first)
+    assert len(first) < 400 * 399 / 2 / 50
+
+
+def test_contacts_exchange_momentum() -> None:
+    """Troca as velocidades das bolas que se aproximam, conservando o momento total"""
+    multiball = build_multiball(300, True, 2)
+    balls = multiball.balls
+    generator = np.random.default_rng(2)
+    balls.ball_state[:] = BallState.RUNNING.value
+    balls.ball_x[:] = generator.integers(800, 1100, balls.count)
+    balls.ball_y[:] = generator.integers(300, 600, balls.count)
+    balls.ball_vx[:] = generator.uniform(-500, 500, balls.count)
+    balls.ball_vy[:] = generator.uniform(-500, 500, balls.count)
+    momentum = (balls.ball_vx.sum(), balls.ball_vy.sum())
+
+    assert multiball.collide()
+    assert multiball.contacts > 0
+    assert np.isclose(balls.ball_vx.sum(), momentum[0])
+    assert np.isclose(balls.ball_vy.sum(), momentum[1])
+
+
+def test_party_match_ends_with_a_winner() -> None:
+    """Joga uma partida com centenas de bolas até o fim, somando ao placar os gols de todas"""
+    multiball = build_multiball(200, True, 3)
+    simulation = multiball.simulation
+    steps = 0
+
+    while simulation.winner is None and steps < 10000:
+        simulation.advance(1 / 60)
+        steps += 1
+
+        # A bola da simulação bate em raquete e parede; os choques de todas as extras viram um único evento
+        assert simulation.events.count(Event.COLLISION) <= 3 * simulation.substeps
+
+    assert simulation.winner is not None
+    assert max(simulation.left_score, simulation.right_score) >= simulation.settings.game_points_max
+
+    simulation.restart()
+
+    assert (simulation.left_score, simulation.right_score) == (0, 0)
+    assert (multiball.balls.ball_state == BallState.READY.value).all()
@@ -0,0 +1,83 @@
+# test_rasterizer.py
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from audio import Audio  # noqa: E402
+from batch_simulation import BatchSimulation  # noqa: E402
+from game import Game  # noqa: E402
+from rasterizer import Rasterizer, to_array, to_gray  # noqa: E402
+from settings import Settings  # noqa: E402
+from side import Side  # noqa: E402
+from state import BALL_X, BALL_Y, PADDLE_Y, SCORE  # noqa: E402
+from text_cache import TextCache  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_settings(size: tuple[int, int]) -> Settings:
+    """Carrega as configurações do jogo na resolução interna indicada"""
+    return Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(
+        render_width=size[0], render_height=size[1]
+    )
+
+
+def test_frames_match_the_game_screen() -> None:
+    """Desenha de uma vez, pixel a pixel, os mesmos quadros que a tela do jogo mostrou"""
+    for size in [(0, 0), (320, 180)]:
+        settings = load_settings(size)
+        pygame.font.init()
+        screen = pygame.surface.Surface(settings.render_size)
+        game = Game(screen, settings, TextCache(settings), Audio(settings))
+        game.simulation.reset(4)
+        values = game.simulation.state.values
+        inputs = random.Random(4)
+        screens = []
+        states = []
+
+        for frame in range(3000):
+            game.simulation.set_direction(Side.LEFT, inputs.random() < 0.4, inputs.random() < 0.4)
+            game.simulation.set_direction(Side.RIGHT, inputs.random() < 0.4, inputs.random() < 0.4)
+            game.process_logic(1 / 60)
+
+            if frame % 50 == 0:
+                game.process_frames()
+                screens.append(to_gray(to_array(screen)))
+                states.append([values[BALL_X], values[BALL_Y], *(values[i] for i in PADDLE_Y + SCORE)])
+
+        states = np.array(states)
+        rasterizer = Rasterizer(settings, len(states))
+        canvas = rasterizer.draw(states[:, 0], states[:, 1], states[:, 2:4], states[:, 4:6].astype(int))
+
+        assert game.simulation.left_score + game.simulation.right_score > 0
+        assert np.array_equal(canvas, np.array(screens))
+
+
+def test_frames_are_downsampled_and_stacked() -> None:
+    """Empilha os quadros reduzidos do mais antigo para o mais recente, recomeçando a pilha em partidas novas"""
+    settings = load_settings((320, 180))
+    bounds = pygame.Rect(0, 0, settings.screen_width, settings.screen_height)
+    batch = BatchSimulation(bounds, settings, 8, seed=1)
+    rasterizer = Rasterizer(settings, batch.count, downsample=4, stack=3)
+    frames = rasterizer.observe(batch)
+
+    assert frames.shape == (8, 3, 45, 80)
+    assert (frames == frames[:, -1:]).all()
+
+    history = []
+
+    for _ in range(240):
+        batch.step()
+        frames = rasterizer.observe(batch)
+        canvas = rasterizer.canvas.reshape(8, 45, 4, 80, 4).astype(float).mean(axis=(2, 4))
+        history.append(frames[:, -1].copy())
+
+        assert np.abs(frames[:, -1] - canvas).max() <= 0.5
+
+    assert np.array_equal(frames[:, 0], history[-3])
+    assert np.array_equal(frames[:, 1], history[-2])
@@ -0,0 +1,60 @@
+# test_replay.py
+
+import os
+import random
+
+import pygame
+from recorder import Recorder
+from replay import Replay
+from settings import Settings
+from side import Side
+from simulation import Simulation
+from state import BALL_X, BALL_Y, PADDLE_Y, SCORE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FIELDS = [BALL_X, BALL_Y, *PADDLE_Y, *SCORE]
+
+
+def record(path: str, seed: int) -> dict[int, list[float]]:
+    """Grava uma partida com entradas, reinícios e intervalos aleatórios e retorna o estado em alguns passos"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(game_points_max=3)
+    simulation = Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, seed)
+    recorder = Recorder(simulation)
+    inputs = random.Random(seed)
+    states = {}
+
+    for frame in range(1500):
+        simulation.set_direction(Side.LEFT, inputs.random() < 0.4, inputs.random() < 0.4)
+        simulation.set_direction(Side.RIGHT, inputs.random() < 0.4, inputs.random() < 0.4)
+
+        if frame % 600 == 599:
+            simulation.restart()
+
+        simulation.advance(inputs.choice([1 / 240, 1 / 60, 1 / 30]))
+        states[simulation.steps] = [simulation.state.values[field] for field in FIELDS]
+
+    recorder.save(path)
+    return states
+
+
+def test_replays_end_in_the_recorded_state(tmp_path) -> None:
+    """Reproduz cada partida gravada até o mesmo estado final"""
+    for seed in range(6):
+        path = str(tmp_path / f"{seed}.rec")
+        record(path, seed)
+
+        assert Replay(path).verify()
+
+
+def test_seek_forward_and_backward(tmp_path) -> None:
+    """Chega ao mesmo estado da gravação ao avançar e ao voltar para um passo"""
+    path = str(tmp_path / "match.rec")
+    states = record(path, 7)
+    replay = Replay(path)
+    steps = sorted(states)
+
+    for step in [steps[len(steps) // 2], steps[-1], steps[10], steps[len(steps) // 3]]:
+        simulation = replay.seek(step)
+
+        assert simulation.steps == step
+        assert [simulation.state.values[field] for field in FIELDS] == states[step]
@@ -0,0 +1,63 @@
+# test_rollback.py
+
+import os
+import random
+import time
+
+import pygame
+from peer import Peer
+from rollback import DOWN, UP, Rollback
+from settings import Settings
+from side import Side
+from simulation import Simulation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_session(settings: Settings, side: Side, local_port: int, remote_port: int) -> tuple[Rollback, Peer]:
+    """Constrói a sessão de rollback e o transporte de um jogador"""
+    simulation = Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, 11)
+    return Rollback(simulation, side), Peer(settings, local_port, ("127.0.0.1", remote_port))
+
+
+def test_sessions_converge_over_lossy_link() -> None:
+    """Termina com o mesmo estado nos dois jogadores, mesmo com atraso, variação e perda de pacotes"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(
+        net_latency=0.004, net_jitter=0.004, net_loss=0.2
+    )
+    sessions = [
+        build_session(settings, Side.LEFT, 50107, 50108),
+        build_session(settings, Side.RIGHT, 50108, 50107),
+    ]
+    inputs = random.Random(3)
+    frames = 600
+    deadline = time.perf_counter() + 30
+
+    try:
+        while time.perf_counter() < deadline:
+            for rollback, peer in sessions:
+                for _, ack, first, remote in peer.receive():
+                    rollback.add_remote_inputs(ack, first, remote)
+
+                if rollback.frame < frames:
+                    bits = (UP if inputs.random() < 0.3 else 0) | (DOWN if inputs.random() < 0.3 else 0)
+                    rollback.advance(bits)
+                elif rollback.rollback_frame is not None:
+                    rollback.resimulate()
+
+                first, pending = rollback.pending_inputs()
+                peer.send(rollback.simulation.seed, len(rollback.remote), first, pending)
+
+            if all(rollback.frame == frames and len(rollback.remote) == frames + rollback.delay for rollback, _ in sessions):
+                if all(rollback.rollback_frame is None for rollback, _ in sessions):
+                    break
+
+            time.sleep(0.001)
+    finally:
+        for _, peer in sessions:
+            peer.close()
+
+    (left, _), (right, _) = sessions
+    assert left.frame == right.frame == frames
+    assert left.simulation.state.values == right.simulation.state.values
+    assert left.stats()["rollbacks"] > 0
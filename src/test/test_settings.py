@@ -0,0 +1,107 @@
+# test_settings.py
+
+import dataclasses
+import json
+import os
+
+import pytest
+from settings import Settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PATH = os.path.join(ROOT, "config", "settings.json")
+
+
+def load_values() -> dict:
+    """Carrega as chaves do arquivo de configurações"""
+    with open(PATH, "r") as file:
+        return json.load(file)
+
+
+def test_load_resolves_resources_and_derived_values() -> None:
+    """Carrega o arquivo do projeto com os recursos e os valores derivados resolvidos"""
+    settings = Settings.load(PATH)
+
+    assert os.path.isfile(settings.font_family)
+    assert settings.time_step == 1.0 / (settings.game_fps * 2.0)
+    assert settings.grid_x[3] == round(settings.screen_width * 0.25)
+    assert settings.grid_y[12] == settings.screen_height
+    assert settings.ball_rgb == (255, 255, 255, 255)
+
+
+def test_settings_are_immutable() -> None:
+    """Impede a alteração das configurações, exigindo uma cópia"""
+    settings = Settings.from_dict(load_values())
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.ball_size = 20
+
+    resized = settings.replace(screen_width=960)
+    assert resized.grid_x[6] == 480
+    assert settings.grid_x[6] == settings.screen_width // 2
+
+
+def test_round_trip() -> None:
+    """Preserva as chaves do arquivo ao converter de volta"""
+    values = load_values()
+    assert Settings.from_dict(values).to_dict() == values
+
+
+@pytest.mark.parametrize(
+    "key, value, message",
+    [
+        ("ball.color", "nocolor", "ball.color: unknown color"),
+        ("ball.size", "10", "ball.size: expected int"),
+        ("render.mode", "fast", "render.mode: expected one of"),
+        ("background.music", "resources/missing.mp3", "background.music: file not found"),
+        ("ball.bounce", 1, "ball.bounce: unknown setting"),
+        ("net.loss", 1.5, "net.loss: expected a number from 0 to 1"),
+        ("physics.swept.distance.max", 0, "physics.swept.distance.max: expected a positive number"),
+        ("profiler.capacity", 0, "profiler.capacity: expected a positive number"),
+    ],
+)
+def test_invalid_values_fail_fast(key: str, value, message: str) -> None:
+    """Rejeita configurações inválidas ao carregar, indicando a chave"""
+    values = load_values()
+    values[key] = value
+
+    with pytest.raises(ValueError, match=message):
+        Settings.from_dict(values, ROOT)
+
+
+def test_missing_key_fails_fast() -> None:
+    """Rejeita configurações sem alguma chave"""
+    values = load_values()
+    del values["paddle.speed"]
+
+    with pytest.raises(ValueError, match="paddle.speed: missing"):
+        Settings.from_dict(values)
+
+
+def test_recording_needs_discrete_mode() -> None:
+    """Rejeita a gravação no modo contínuo, que não tem passos fixos para reproduzir"""
+    values = load_values()
+    values["record.directory"] = "recordings"
+    values["physics.collision.mode"] = "swept"
+
+    with pytest.raises(ValueError, match="record.directory: recording needs"):
+        Settings.from_dict(values)
+
+
+def test_online_play_needs_discrete_mode() -> None:
+    """Rejeita o jogo em rede no modo contínuo, que não tem passos fixos para ressimular"""
+    values = load_values()
+    values["net.remote.host"] = "127.0.0.1"
+    values["physics.collision.mode"] = "swept"
+
+    with pytest.raises(ValueError, match="net.remote.host: online play needs"):
+        Settings.from_dict(values)
+
+
+def test_several_balls_cannot_be_recorded() -> None:
+    """Rejeita a gravação com bolas extras, cujo estado fica fora do bloco da simulação"""
+    values = load_values()
+    values["record.directory"] = "recordings"
+    values["ball.count"] = 50
+
+    with pytest.raises(ValueError, match="ball.count: several balls cannot be recorded"):
+        Settings.from_dict(values)
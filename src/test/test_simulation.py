@@ -0,0 +1,124 @@
+# test_simulation.py
+
+import os
+import random
+
+import pygame
+from ball import Ball
+from ball_state import BallState
+from settings import Settings
+from side import Side
+from simulation import RUNNING, Simulation
+from state import BALL_STATE, BALL_VX, BALL_VY, BALL_X, BALL_Y, PADDLE_Y, PREVIOUS_BALL_X
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_simulation(seed: int, **changes) -> Simulation:
+    """Constrói uma simulação do tamanho da tela configurada"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(**changes)
+    return Simulation(pygame.Rect(0, 0, settings.screen_width, settings.screen_height), settings, seed)
+
+
+def play(simulation: Simulation, inputs: random.Random, frames: int) -> list[tuple]:
+    """Avança a simulação com entradas aleatórias e retorna o estado de cada quadro"""
+    states = []
+
+    for _ in range(frames):
+        simulation.set_direction(Side.LEFT, inputs.random() < 0.4, inputs.random() < 0.4)
+        simulation.set_direction(Side.RIGHT, inputs.random() < 0.4, inputs.random() < 0.4)
+        simulation.advance(1 / 60)
+        states.append((tuple(simulation.state.values), tuple(simulation.events)))
+
+    return states
+
+
+def test_restore_replays_the_same_future() -> None:
+    """Repete exatamente o mesmo futuro, com saques sorteados, depois de restaurar uma cópia do estado"""
+    simulation = build_simulation(7)
+    play(simulation, random.Random(1), 300)
+    snapshot = simulation.snapshot()
+
+    first = play(simulation, random.Random(2), 1200)
+    simulation.restore(snapshot)
+    second = play(simulation, random.Random(2), 1200)
+
+    assert first == second
+    assert any(state[0] != first[0][0] for state in first)
+
+
+def test_same_seed_same_match() -> None:
+    """Produz a mesma partida para a mesma semente e as mesmas entradas"""
+    first = play(build_simulation(3), random.Random(4), 900)
+    second = play(build_simulation(3), random.Random(4), 900)
+
+    assert first == second
+
+
+def test_stall_is_clamped_to_steps_max() -> None:
+    """Limita os passos de recuperação depois de uma pausa longa e contabiliza o tempo descartado"""
+    simulation = build_simulation(5)
+    simulation.advance(1.0)
+
+    assert simulation.substeps == simulation.settings.physics_steps_max
+    assert simulation.accumulator < simulation.time_step
+    assert simulation.clamps == 1
+    assert simulation.clamped_time == simulation.clamped > 0.5
+
+
+def test_interpolated_ball_lies_between_steps() -> None:
+    """Desenha a bola entre as posições dos dois últimos passos, na fração do tempo acumulado"""
+    simulation = build_simulation(5, render_interpolation=True)
+    ball = Ball(simulation.ball, simulation.state, simulation.settings)
+    while simulation.ball_state != BallState.RUNNING:
+        simulation.advance(simulation.time_step)
+
+    simulation.advance(simulation.time_step * 1.5)
+    ball.update()
+    values = simulation.state.values
+
+    assert values[PREVIOUS_BALL_X] != values[BALL_X]
+    assert ball.rect.x == round(values[PREVIOUS_BALL_X] + (values[BALL_X] - values[PREVIOUS_BALL_X]) * 0.5)
+
+
+def test_swept_ball_at_speed_max_bounces_off_paddle() -> None:
+    """Rebate na raquete uma bola na velocidade máxima, que no modo discreto atravessaria a raquete"""
+    simulation = build_simulation(5, physics_collision_mode="swept")
+    values = simulation.state.values
+    paddle = simulation.paddles[0]
+    values[BALL_STATE] = RUNNING
+    values[BALL_X] = paddle.rect.right + 30
+    values[BALL_Y] = values[PADDLE_Y[0]] + paddle.rect.height // 2
+    values[BALL_VX] = -simulation.settings.ball_speed_max
+    values[BALL_VY] = 0.0
+
+    for _ in range(6):
+        simulation.advance(1 / 60)
+
+    assert values[BALL_VX] > 0
+    assert values[BALL_X] >= paddle.rect.right
+    assert simulation.left_score == simulation.right_score == 0
+
+
+def test_swept_paddle_speed_does_not_depend_on_ball_speed() -> None:
+    """Move a raquete igualmente no modo contínuo, seja a bola lenta ou rápida, e como no modo discreto"""
+    travels = []
+
+    for mode, speed in [("discrete", 500), ("swept", 500), ("swept", 2500)]:
+        simulation = build_simulation(5, physics_collision_mode=mode)
+        values = simulation.state.values
+        values[BALL_STATE] = RUNNING
+        values[BALL_X] = simulation.bounds.centerx
+        values[BALL_Y] = simulation.bounds.centery
+        values[BALL_VX] = 0.0
+        values[BALL_VY] = speed
+        start = values[PADDLE_Y[0]]
+
+        for _ in range(10):
+            simulation.set_direction(Side.LEFT, False, True)
+            simulation.advance(1 / 60)
+
+        travels.append(values[PADDLE_Y[0]] - start)
+
+    assert travels[0] > 0
+    assert travels[0] == travels[1] == travels[2]
@@ -0,0 +1,39 @@
+# test_tournament.py
+
+import json
+import os
+
+from settings import Settings
+from tournament import build_grid, build_sample, run
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_grid_and_sample() -> None:
+    """Monta todas as combinações da grade e sorteios dentro dos intervalos"""
+    grid = build_grid(["ball.acceleration=1.05,1.1", "paddle.speed=200,250,300"])
+    sample = build_sample(["ball.angle.max=30:60", "ball.acceleration=1.0:1.2"], 5, 1)
+
+    assert len(grid) == 6
+    assert {"ball.acceleration": 1.1, "paddle.speed": 300} in grid
+    assert len(sample) == 5
+    assert all(30 <= overrides["ball.angle.max"] <= 60 for overrides in sample)
+    assert all(isinstance(overrides["ball.angle.max"], int) for overrides in sample)
+
+
+def test_sweep_streams_results_and_resumes(tmp_path) -> None:
+    """Grava um resultado por configuração e, ao retomar, joga só as que faltam"""
+    base = Settings.load(os.path.join(ROOT, "config", "settings.json")).to_dict()
+    output = str(tmp_path / "results.jsonl")
+    configurations = build_grid(["ball.acceleration=1.05,1.2", "game.points.max=1"])
+
+    assert run(configurations[:1], base, output, 2, seconds_max=60, workers=2) == 1
+    assert run(configurations, base, output, 2, seconds_max=60, workers=2) == 1
+    assert run(configurations, base, output, 2, seconds_max=60, workers=2) == 0
+
+    with open(output, "r") as file:
+        results = [json.loads(line) for line in file]
+
+    assert sorted(result["overrides"]["ball.acceleration"] for result in results) == [1.05, 1.2]
+    assert all(sum(result["wins"].values()) == 2 for result in results)
+    assert all(len(result["speed"]["histogram"]["counts"]) == 10 for result in results)
@@ -0,0 +1,47 @@
+# test_view.py
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from audio import Audio  # noqa: E402
+from game import Game  # noqa: E402
+from settings import Settings  # noqa: E402
+from side import Side  # noqa: E402
+from text_cache import TextCache  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def play(size: tuple[int, int]) -> tuple[tuple, pygame.Rect]:
+    """Joga uma partida na resolução interna indicada e retorna o estado final e a área da bola"""
+    settings = Settings.load(os.path.join(ROOT, "config", "settings.json")).replace(
+        render_width=size[0], render_height=size[1]
+    )
+    pygame.init()
+    screen = pygame.display.set_mode(settings.render_size)
+    game = Game(screen, settings, TextCache(settings), Audio(settings))
+    game.simulation.reset(9)
+    inputs = random.Random(9)
+
+    for _ in range(900):
+        game.simulation.set_direction(Side.LEFT, inputs.random() < 0.4, inputs.random() < 0.4)
+        game.simulation.set_direction(Side.RIGHT, inputs.random() < 0.4, inputs.random() < 0.4)
+        game.process_logic(1 / 60)
+        game.process_frames()
+
+    return tuple(game.simulation.state.values), game.ball.rect.copy()
+
+
+def test_internal_resolution_does_not_change_gameplay() -> None:
+    """Produz a mesma partida em qualquer resolução interna, só com a bola desenhada em escala"""
+    full_state, full_ball = play((1920, 1080))
+    low_state, low_ball = play((480, 270))
+    pygame.quit()
+
+    assert full_state == low_state
+    assert low_ball.size == (full_ball.width // 4, full_ball.height // 4)
+    assert abs(low_ball.x - full_ball.x / 4) <= 1